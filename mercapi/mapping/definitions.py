@@ -1,6 +1,21 @@
 import logging
+import types
+from collections import OrderedDict
 from datetime import datetime
-from typing import NamedTuple, List, Dict, TypeVar, Type, Any, Optional, Callable
+from typing import (
+    NamedTuple,
+    List,
+    Dict,
+    TypeVar,
+    Type,
+    Any,
+    Optional,
+    Callable,
+    Tuple,
+    Iterable,
+    FrozenSet,
+    TYPE_CHECKING,
+)
 
 from mercapi.models import Item, Items, Profile, SearchResults, SearchResultItem
 from mercapi.models.common import ItemCategory, ItemCategorySummary
@@ -57,10 +72,13 @@ from mercapi.models.item.data import (
     AuctionInfo,
 )
 from mercapi.util.errors import ParseAPIResponseError
-from mercapi.models.base import ResponseModel
+from mercapi.models.base import ResponseModel, compact_model
 from mercapi.models.profile.items import SellerItem
 from mercapi.models.search import Meta
 
+if TYPE_CHECKING:
+    from mercapi.mapping.interning import Interner
+
 T = TypeVar("T")
 ExtractorDef = Callable[[dict], Optional[T]]
 
@@ -76,6 +94,24 @@ class ResponseMappingDefinition(NamedTuple):
     optional_properties: List[ResponseProperty]
 
 
+class ExtractorInfo(NamedTuple):
+    """Describes what an extractor created by `Extractors` does,
+    so that the mapping can be optimized without calling it."""
+
+    kind: str
+    key: str
+    type_: Optional[type] = None
+    model: Optional[Type[ResponseModel]] = None
+    mapping_definition: Optional[ResponseMappingDefinition] = None
+    mapper: Optional[Callable[[Any], Any]] = None
+    keys: Tuple[str, ...] = ()
+
+
+def _described(extractor: ExtractorDef[T], *args, **kwargs) -> ExtractorDef[T]:
+    extractor.extractor_info = ExtractorInfo(*args, **kwargs)
+    return extractor
+
+
 class Extractors:
     """
     Collection of HOFs for parsing API responses in the most common ways.
@@ -86,13 +122,15 @@ class Extractors:
 
     @staticmethod
     def get(key: str) -> ExtractorDef[Any]:
-        return lambda x: x.get(key)
+        return _described(lambda x: x.get(key), "get", key)
 
     S = TypeVar("S", int, float, str)
 
     @staticmethod
     def get_as(key: str, type_: Type[S]) -> ExtractorDef[S]:
-        return lambda x: type_(x[key]) if key in x else None
+        return _described(
+            lambda x: type_(x[key]) if key in x else None, "get_as", key, type_=type_
+        )
 
     M = TypeVar("M", bound=ResponseModel)
 
@@ -102,11 +140,24 @@ class Extractors:
     ) -> ExtractorDef[M]:
         if type(model) == str:
             model = Extractors.__import_class(model)
-        return lambda x: map_to_class(x[key], model, map_def) if key in x and x[key] is not None else None
+        return _described(
+            lambda x: map_to_class(x[key], model, map_def)
+            if key in x and x[key] is not None
+            else None,
+            "get_as_model",
+            key,
+            model=model,
+            mapping_definition=map_def,
+        )
 
     @staticmethod
     def get_with(key: str, mapper: Callable[[S], T]) -> ExtractorDef[T]:
-        return lambda x: mapper(x[key]) if key in x else None
+        return _described(
+            lambda x: mapper(x[key]) if key in x else None,
+            "get_with",
+            key,
+            mapper=mapper,
+        )
 
     @staticmethod
     def get_list_with(key: str, mapper: Callable[[Any], T]) -> ExtractorDef[List[T]]:
@@ -116,11 +167,24 @@ class Extractors:
     def get_list_of_model(key: str, model: Type[M]) -> ExtractorDef[List[M]]:
         if type(model) == str:
             model = Extractors.__import_class(model)
-        return lambda x: [map_to_class(i, model) for i in x[key]] if key in x and x[key] is not None else None
+        return _described(
+            lambda x: [map_to_class(i, model) for i in x[key]]
+            if key in x and x[key] is not None
+            else None,
+            "get_list_of_model",
+            key,
+            model=model,
+        )
 
     @staticmethod
     def get_datetime(key: str) -> ExtractorDef[datetime]:
-        return Extractors.get_with(key, lambda x: datetime.fromtimestamp(float(x)))
+        mapper = lambda x: datetime.fromtimestamp(float(x))
+        return _described(
+            lambda x: mapper(x[key]) if key in x else None,
+            "get_datetime",
+            key,
+            mapper=mapper,
+        )
 
     @staticmethod
     def get_either(*keys: str) -> ExtractorDef[Any]:
@@ -130,7 +194,7 @@ class Extractors:
                 if key in x and x[key] is not None:
                     return x[key]
             return None
-        return extractor
+        return _described(extractor, "get_either", keys[0], keys=keys)
 
     @staticmethod
     def __import_class(model: str) -> Type[ResponseModel]:
@@ -1259,7 +1323,26 @@ def map_to_class(
     response: dict,
     clazz: Type[RM],
     mapping_definition: ResponseMappingDefinition = None,
+    fields: Optional[Iterable[str]] = None,
+    lazy: bool = False,
+    compact: bool = False,
+    interner: Optional["Interner"] = None,
 ) -> RM:
+    """Map an API response to a model instance.
+
+    :param response: decoded JSON object
+    :param clazz: model class
+    :param mapping_definition: definition used instead of the default one of `clazz`
+    :param fields: names of model properties to extract, all if not provided;
+        remaining properties are set to `None` without looking into the response
+    :param lazy: map nested models only when they are accessed for the first time,
+        see :func:`compile_mapping`
+    :param compact: create instances of compact variants of models without `__dict__`,
+        see :func:`mercapi.models.base.compact_model`
+    :param interner: interner sharing instances of nested lookup models,
+        see `mercapi.mapping.interning.Interner`
+    :return: model instance
+    """
     if clazz == ResponseModel:
         raise TypeError(
             "map_to_class() is supposed to be called with ResponseModel subclass as a parameter"
@@ -1270,28 +1353,320 @@ def map_to_class(
     if mapping_definition is None:
         raise ValueError(f"Mapping definition is not provided for {clazz.__name__}")
 
-    init_properties = {}
+    if fields is not None and not isinstance(fields, frozenset):
+        fields = frozenset(fields)
+    # mappers using an interner are kept by it, so that they are freed together
+    cache = _compiled_mappers if interner is None else interner._compiled_mappers
+    key = (clazz, id(mapping_definition), fields, lazy, compact)
+    compiled = cache.get(key)
+    if compiled is None or compiled[0] is not mapping_definition:
+        compiled = (
+            mapping_definition,
+            compile_mapping(clazz, mapping_definition, fields, lazy, compact, interner),
+        )
+        # definition is kept alive in the cache, so that its id is not reused
+        cache[key] = compiled
+        if len(cache) > COMPILED_MAPPERS_MAXSIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return compiled[1](response)
+
+
+COMPILED_MAPPERS_MAXSIZE = 256
+"""Maximum number of compiled mappers kept by :func:`map_to_class`, the least recently used ones are dropped first"""
+
+_MapperKey = Tuple[type, int, Optional[FrozenSet[str]], bool, bool]
+_compiled_mappers: "OrderedDict[_MapperKey, Tuple[ResponseMappingDefinition, Callable]]" = (
+    OrderedDict()
+)
+
+
+def compile_mapping(
+    clazz: Type[RM],
+    mapping_definition: ResponseMappingDefinition,
+    fields: Optional[FrozenSet[str]] = None,
+    lazy: bool = False,
+    compact: bool = False,
+    interner: Optional["Interner"] = None,
+) -> Callable[[dict], RM]:
+    """Generate a function mapping a response to `clazz` instance according to the definition.
+
+    The function is equivalent to applying extractors of all properties in order
+    and passing their results to the constructor, including the error handling:
+    missing required property raises `ParseAPIResponseError`, while an optional one
+    that could not be parsed is reported and set to `None`.
+    Extractors created with `Extractors.get`, `get_as`, `get_with` and
+    `get_datetime` are inlined instead of being called.
+
+    With `fields` provided, only the listed model properties are extracted
+    (and required), others are set to `None`.
+
+    With `lazy` set, properties holding nested models (extracted with
+    `Extractors.get_as_model` or `get_list_of_model`) are not mapped until they
+    are accessed for the first time; the result is kept afterwards. Errors of
+    these properties are raised or reported on access as well. Instances are
+    created as a subclass of `clazz` keeping a reference to the response,
+    they are pickled as instances of `clazz` with all properties mapped.
+
+    With `compact` set, instances of `clazz` and nested models are created
+    as their compact variants (see :func:`mercapi.models.base.compact_model`).
+
+    With `interner` provided, nested models it interns are shared between
+    instances mapped from identical response objects, and values of string
+    properties it interns are shared between all mapped instances.
+    """
+    if fields is not None:
+        unknown = fields - {
+            prop.model_property_name
+            for prop in mapping_definition.required_properties
+            + mapping_definition.optional_properties
+        }
+        if unknown:
+            raise ValueError(
+                f"Unknown {clazz.__name__} properties: {', '.join(sorted(unknown))}"
+            )
+
+    namespace = {
+        "_clazz": compact_model(clazz) if compact else clazz,
+        "_fromtimestamp": datetime.fromtimestamp,
+        "_report_incorrect_optional": _report_incorrect_optional,
+        "ParseAPIResponseError": ParseAPIResponseError,
+    }
+    interned_strings: FrozenSet[str] = frozenset()
+    if interner is not None:
+        interned_strings = interner.string_properties(clazz)
+        namespace["_intern_string"] = interner.intern_string
+    lines = ["def _map(response):"]
+    arguments = {}
+    deferred = {}
+
+    for i, prop in enumerate(mapping_definition.required_properties):
+        var = f"_r{i}"
+        if fields is not None and prop.model_property_name not in fields:
+            arguments[prop.model_property_name] = "None"
+            continue
+        if lazy and _is_nested_model(prop):
+            deferred[prop.model_property_name] = _deferred_extractor(
+                clazz, prop, True, compact, interner
+            )
+            arguments[prop.model_property_name] = "_DEFERRED"
+            continue
+        message = f"Failed to retrieve required {clazz.__name__} property {prop.raw_property_name} from the response"
+        lines += [
+            "    try:",
+            f"        {var} = {_extractor_expression(prop, var, namespace, compact, interner, interned_strings)}",
+            f"        if {var} is None:",
+            "            raise ValueError('Extractor returned None value')",
+            "    except Exception as exc:",
+            f"        raise ParseAPIResponseError({message!r}) from exc",
+        ]
+        arguments[prop.model_property_name] = var
+
+    for i, prop in enumerate(mapping_definition.optional_properties):
+        var = f"_o{i}"
+        if fields is not None and prop.model_property_name not in fields:
+            arguments[prop.model_property_name] = "None"
+            continue
+        if lazy and _is_nested_model(prop):
+            deferred[prop.model_property_name] = _deferred_extractor(
+                clazz, prop, False, compact, interner
+            )
+            arguments[prop.model_property_name] = "_DEFERRED"
+            continue
+        lines += [
+            "    try:",
+            f"        {var} = {_extractor_expression(prop, var, namespace, compact, interner, interned_strings)}",
+            "    except Exception as exc:",
+            f"        _report_incorrect_optional({prop.raw_property_name!r}, response, exc)",
+            f"        {var} = None",
+        ]
+        arguments[prop.model_property_name] = var
 
-    for prop in mapping_definition.required_properties:
+    call_arguments = ", ".join(f"{k}={v}" for k, v in arguments.items())
+    if deferred:
+        namespace["_clazz"] = _lazy_model(namespace["_clazz"], deferred)
+        namespace["_new"] = object.__new__
+        namespace["_DEFERRED"] = _DEFERRED
+        lines += [
+            "    obj = _new(_clazz)",
+            "    obj._lazy_response = response",
+            f"    obj.__init__({call_arguments})",
+            "    return obj",
+        ]
+    else:
+        lines.append(f"    return _clazz({call_arguments})")
+    exec(compile("\n".join(lines), f"<mapping of {clazz.__name__}>", "exec"), namespace)
+    return namespace["_map"]
+
+
+def _extractor_expression(
+    prop: ResponseProperty,
+    var: str,
+    namespace: dict,
+    compact: bool,
+    interner: Optional["Interner"],
+    interned_strings: FrozenSet[str] = frozenset(),
+) -> str:
+    if prop.model_property_name in interned_strings:
+        expression = _extractor_expression(prop, var, namespace, compact, interner)
+        return f"_intern_string({expression})"
+    info: Optional[ExtractorInfo] = getattr(prop.extractor, "extractor_info", None)
+    if (compact or interner is not None) and _is_nested_model(prop):
+        namespace[f"{var}_extractor"] = _model_extractor(info, False, compact, interner)
+        return f"{var}_extractor(response)"
+    if info is not None:
+        key = repr(info.key)
+        if info.kind == "get":
+            return f"response.get({key})"
+        if info.kind == "get_as":
+            namespace[f"{var}_type"] = info.type_
+            return f"{var}_type(response[{key}]) if {key} in response else None"
+        if info.kind == "get_with":
+            namespace[f"{var}_mapper"] = info.mapper
+            return f"{var}_mapper(response[{key}]) if {key} in response else None"
+        if info.kind == "get_datetime":
+            return (
+                f"_fromtimestamp(float(response[{key}])) if {key} in response else None"
+            )
+    namespace[f"{var}_extractor"] = prop.extractor
+    return f"{var}_extractor(response)"
+
+
+def _is_nested_model(prop: ResponseProperty) -> bool:
+    info: Optional[ExtractorInfo] = getattr(prop.extractor, "extractor_info", None)
+    return info is not None and info.kind in ("get_as_model", "get_list_of_model")
+
+
+def _model_extractor(
+    info: ExtractorInfo,
+    lazy: bool,
+    compact: bool,
+    interner: Optional["Interner"] = None,
+) -> ExtractorDef[Any]:
+    key, model = info.key, info.model
+    map_def = info.mapping_definition if info.kind == "get_as_model" else None
+
+    def map_one(x: dict) -> Any:
+        return map_to_class(
+            x, model, map_def, lazy=lazy, compact=compact, interner=interner
+        )
+
+    if interner is not None and interner.interns(model):
+        map_new = map_one
+        variant = (id(map_def), lazy, compact)
+        map_one = lambda x: interner.intern(model, x, map_new, variant)
+
+    if info.kind == "get_as_model":
+        return lambda x: map_one(x[key]) if key in x and x[key] is not None else None
+    return (
+        lambda x: [map_one(i) for i in x[key]]
+        if key in x and x[key] is not None
+        else None
+    )
+
+
+def _deferred_extractor(
+    clazz: type,
+    prop: ResponseProperty,
+    required: bool,
+    compact: bool,
+    interner: Optional["Interner"],
+) -> ExtractorDef[Any]:
+    extractor = _model_extractor(prop.extractor.extractor_info, True, compact, interner)
+
+    def extract(response: dict) -> Any:
         try:
-            raw_prop = prop.extractor(response)
-            if raw_prop is None:
+            value = extractor(response)
+            if required and value is None:
                 raise ValueError("Extractor returned None value")
-            init_properties[prop.model_property_name] = raw_prop
         except Exception as exc:
-            raise ParseAPIResponseError(
-                f"Failed to retrieve required {clazz.__name__} property {prop.raw_property_name} from the response"
-            ) from exc
+            if required:
+                raise ParseAPIResponseError(
+                    f"Failed to retrieve required {clazz.__name__} property {prop.raw_property_name} from the response"
+                ) from exc
+            _report_incorrect_optional(prop.raw_property_name, response, exc)
+            value = None
+        return value
+
+    return extract
 
-    for prop in mapping_definition.optional_properties:
-        raw_prop = None
+
+_DEFERRED = object()
+
+
+class _LazyProperty:
+    """Property of a lazy model, mapped from the response on first access.
+
+    The value is kept in the slot of the property if the model has one
+    (compact variants), in the instance `__dict__` otherwise.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        extractor: ExtractorDef[Any],
+        slot: Optional[types.MemberDescriptorType] = None,
+    ):
+        self._name = name
+        self._extractor = extractor
+        self._slot = slot
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if self._slot is not None:
+            try:
+                return self._slot.__get__(obj, objtype)
+            except AttributeError:
+                value = self._extractor(obj._lazy_response)
+                self._slot.__set__(obj, value)
+                return value
+        values = obj.__dict__
         try:
-            raw_prop = prop.extractor(response)
-        except Exception as exc:
-            _report_incorrect_optional(prop.raw_property_name, response, exc)
-        init_properties[prop.model_property_name] = raw_prop
+            return values[self._name]
+        except KeyError:
+            value = values[self._name] = self._extractor(obj._lazy_response)
+            return value
+
+    def __set__(self, obj, value) -> None:
+        if value is _DEFERRED:
+            return
+        if self._slot is not None:
+            self._slot.__set__(obj, value)
+        else:
+            obj.__dict__[self._name] = value
+
+
+def _lazy_model(clazz: Type[RM], deferred: Dict[str, ExtractorDef[Any]]) -> Type[RM]:
+    namespace = {}
+    for name, extractor in deferred.items():
+        slot = getattr(clazz, name, None)
+        if not isinstance(slot, types.MemberDescriptorType):
+            slot = None
+        namespace[name] = _LazyProperty(name, extractor, slot)
+
+    def __reduce__(self):
+        # lazy classes cannot be looked up by name, so instances are pickled
+        # as instances of `clazz`, with all properties mapped
+        for name in deferred:
+            getattr(self, name)
+        if "__reduce__" in clazz.__dict__:
+            return clazz.__reduce__(self)
+        return _restore_model, (clazz, dict(self.__dict__))
+
+    # compact variants stay without __dict__
+    namespace["__slots__"] = ("_lazy_response",)
+    namespace["__reduce__"] = __reduce__
+    namespace["__module__"] = clazz.__module__
+    namespace["__qualname__"] = f"Lazy{clazz.__qualname__}"
+    return type(f"Lazy{clazz.__name__}", (clazz,), namespace)
+
 
-    return clazz(**init_properties)
+def _restore_model(clazz: Type[RM], values: Dict[str, Any]) -> RM:
+    obj = object.__new__(clazz)
+    obj.__dict__.update(values)
+    return obj
 
 
 def _report_incorrect_optional(prop: str, response: dict, exc: Exception) -> None:
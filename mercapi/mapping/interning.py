@@ -0,0 +1,191 @@
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from mercapi.models.base import ResponseModel
+from mercapi.models.common import ItemCategorySummary
+from mercapi.models.item.data import (
+    ItemCondition,
+    Color,
+    ShippingPayer,
+    ShippingMethod,
+    ShippingFromArea,
+    ShippingDuration,
+    ShippingClass,
+    ItemSize,
+    ItemBrand,
+)
+from mercapi.models.profile.items import SellerItem
+from mercapi.models.search.search_result_item import SearchResultItem
+from mercapi.models.shop.data import (
+    ShopProductCategory,
+    ShopProductBrand,
+    ShopProductCondition,
+    ShopProductShippingMethod,
+    ShopProductShippingPayer,
+    ShopProductShippingDuration,
+    ShopProductShippingFromArea,
+)
+from mercapi.util.cache import CacheStats
+
+
+class Interner:
+    """Shares instances of lookup models (e.g. conditions, shipping methods)
+    mapped from identical response objects.
+
+    Only flat response objects, holding no lists or objects, are interned.
+    Interned instances are shared between all results containing them,
+    they should be treated as read-only.
+
+    Values of string properties repeating across results (e.g. statuses,
+    seller ids, brand names) are interned as well, so that equal strings
+    decoded from different responses are stored once.
+    """
+
+    DEFAULT_MODELS: Tuple[Type[ResponseModel], ...] = (
+        ItemCondition,
+        Color,
+        ShippingPayer,
+        ShippingMethod,
+        ShippingFromArea,
+        ShippingDuration,
+        ShippingClass,
+        ItemCategorySummary,
+        ItemSize,
+        ItemBrand,
+        ShopProductCategory,
+        ShopProductBrand,
+        ShopProductCondition,
+        ShopProductShippingMethod,
+        ShopProductShippingPayer,
+        ShopProductShippingDuration,
+        ShopProductShippingFromArea,
+    )
+    """Models interned if not specified otherwise"""
+
+    DEFAULT_STRINGS: Mapping[Type[ResponseModel], Tuple[str, ...]] = {
+        SearchResultItem: ("seller_id", "status", "item_type", "shop_name"),
+        SellerItem: ("seller_id", "status"),
+        ItemCategorySummary: ("name", "parent_category_name", "root_category_name"),
+        ItemBrand: ("name", "sub_name"),
+        ItemSize: ("name",),
+    }
+    """String properties of models interned if not specified otherwise"""
+
+    def __init__(
+        self,
+        models: Optional[Iterable[Type[ResponseModel]]] = None,
+        *,
+        strings: Optional[Mapping[Type[ResponseModel], Iterable[str]]] = None,
+        maxsize: int = 65536,
+        max_strings: int = 65536,
+    ):
+        """initialize
+
+        :param models: models to intern, `DEFAULT_MODELS` are interned if not provided
+        :param strings: string properties to intern for models, `DEFAULT_STRINGS` are interned if not provided
+        :param maxsize: maximum number of interned instances, the oldest ones are forgotten first
+        :param max_strings: maximum number of interned strings, the oldest ones are forgotten first
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        if max_strings < 1:
+            raise ValueError("max_strings must be a positive integer")
+
+        self._models = frozenset(self.DEFAULT_MODELS if models is None else models)
+        self._string_properties: Dict[Type[ResponseModel], FrozenSet[str]] = {
+            model: frozenset(properties)
+            for model, properties in (
+                self.DEFAULT_STRINGS if strings is None else strings
+            ).items()
+        }
+        self._maxsize = maxsize
+        self._max_strings = max_strings
+        self._instances: Dict[Hashable, Any] = {}
+        self._strings: Dict[str, str] = {}
+        # mappers compiled by `map_to_class` for this interner, freed together with it
+        self._compiled_mappers: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def interns(self, model: Type[ResponseModel]) -> bool:
+        return model in self._models
+
+    def intern(
+        self,
+        model: Type[ResponseModel],
+        response: dict,
+        map_fn: Callable[[dict], Any],
+        variant: Hashable = None,
+    ) -> Any:
+        """Get the instance mapped from an identical response object before,
+        or map and remember a new one.
+
+        :param model: model class
+        :param response: response object the instance is mapped from
+        :param map_fn: function mapping the response object to an instance
+        :param variant: options of mapping the instance depends on
+        """
+        try:
+            key = (model, variant, frozenset(response.items()))
+        except (AttributeError, TypeError):
+            # not a flat object, mapped as usual
+            self._misses += 1
+            return map_fn(response)
+
+        instance = self._instances.get(key)
+        if instance is not None:
+            self._hits += 1
+            return instance
+
+        self._misses += 1
+        instance = map_fn(response)
+        if len(self._instances) >= self._maxsize:
+            del self._instances[next(iter(self._instances))]
+            self._evictions += 1
+        self._instances[key] = instance
+        return instance
+
+    def string_properties(self, model: Type[ResponseModel]) -> FrozenSet[str]:
+        return self._string_properties.get(model, frozenset())
+
+    def intern_string(self, value: Any) -> Any:
+        """Get a string equal to `value` seen before, or remember `value`.
+
+        Lists of strings have their items interned, other values are returned as they are.
+        """
+        if type(value) is list:
+            return [self.intern_string(v) for v in value]
+        if type(value) is not str:
+            return value
+        interned = self._strings.get(value)
+        if interned is not None:
+            return interned
+        if len(self._strings) >= self._max_strings:
+            del self._strings[next(iter(self._strings))]
+        self._strings[value] = value
+        return value
+
+    def clear(self) -> None:
+        self._instances.clear()
+        self._strings.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            self._hits, self._misses, self._evictions, len(self._instances)
+        )
+
+    def __len__(self) -> int:
+        return len(self._instances)
@@ -0,0 +1,173 @@
+"""Decoding of API responses straight into typed structs, using msgspec.
+
+Structs are generated from the mapping definitions in `mercapi.mapping.definitions`
+and have the same properties as models, with values converted in the same way.
+Response bytes are decoded in a single pass, without building intermediate
+dicts and calling extractors. Structs are plain data, they do not provide
+methods of models (e.g. `SearchResultItem.full_item`).
+
+Unlike :func:`~mercapi.mapping.map_to_class`, a property that could not be
+parsed fails the whole decoding, even if it is optional.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import msgspec
+
+from mercapi.mapping.definitions import (
+    ExtractorInfo,
+    ResponseMappingDefinition,
+    mapping_definitions,
+)
+from mercapi.models.base import ResponseModel
+from mercapi.util.errors import ParseAPIResponseError
+
+
+def _post_init(
+    converted: Dict[str, Callable[[Any], Any]],
+    either: Dict[str, Tuple[str, ...]],
+    required: Tuple[str, ...],
+):
+    def __post_init__(self) -> None:
+        for name, mapper in converted.items():
+            value = getattr(self, name)
+            if value is not None:
+                setattr(self, name, mapper(value))
+        for name, alternatives in either.items():
+            for alternative in alternatives:
+                if getattr(self, name) is not None:
+                    break
+                setattr(self, name, getattr(self, alternative))
+        for name in required:
+            if getattr(self, name) is None:
+                raise ValueError(f"Required property {name} is missing")
+
+    return __post_init__
+
+
+_structs: Dict[Tuple[type, int], Tuple[ResponseMappingDefinition, str]] = {}
+_decoders: Dict[Tuple[type, Optional[str]], Callable[[bytes], Any]] = {}
+
+
+def struct_type(
+    clazz: Type[ResponseModel], mapping_definition: ResponseMappingDefinition = None
+) -> Type[msgspec.Struct]:
+    """Get a struct type equivalent to a model.
+
+    :param clazz: model class
+    :param mapping_definition: definition used instead of the default one of `clazz`
+    :return: struct type, named after the model with "Struct" suffix,
+        defined in this module
+    """
+    return globals()[_struct_name(clazz, mapping_definition)]
+
+
+def _struct_name(
+    clazz: Type[ResponseModel], mapping_definition: ResponseMappingDefinition = None
+) -> str:
+    if mapping_definition is None:
+        mapping_definition = mapping_definitions.get(clazz)
+    if mapping_definition is None:
+        raise ValueError(f"Mapping definition is not provided for {clazz.__name__}")
+
+    cached = _structs.get((clazz, id(mapping_definition)))
+    if cached is None or cached[0] is not mapping_definition:
+        name = f"{clazz.__name__}Struct"
+        suffix = 1
+        while name in globals():
+            suffix += 1
+            name = f"{clazz.__name__}Struct{suffix}"
+        # registered before the struct is defined, so that models nested
+        # in themselves refer to it by name
+        cached = (mapping_definition, name)
+        _structs[(clazz, id(mapping_definition))] = cached
+        globals()[name] = _define_struct(clazz, mapping_definition, name)
+    return cached[1]
+
+
+def struct_decoder(
+    clazz: Type[ResponseModel], envelope: Optional[str] = None
+) -> Callable[[bytes], Any]:
+    """Get a function decoding a response into a struct equivalent to a model.
+
+    :param clazz: model class
+    :param envelope: key of the response object the model is nested under (e.g. "data")
+    :return: function raising `ParseAPIResponseError` on failure
+    """
+    decode = _decoders.get((clazz, envelope))
+    if decode is None:
+        type_ = struct_type(clazz)
+        if envelope is not None:
+            type_ = msgspec.defstruct(
+                f"{clazz.__name__}Envelope", [(envelope, type_)], kw_only=True
+            )
+        decoder = msgspec.json.Decoder(type_)
+
+        def decode(data: bytes) -> Any:
+            try:
+                res = decoder.decode(data)
+            except (msgspec.ValidationError, msgspec.DecodeError) as exc:
+                raise ParseAPIResponseError(
+                    f"Failed to decode {clazz.__name__} from the response: {exc}"
+                ) from exc
+            return getattr(res, envelope) if envelope is not None else res
+
+        _decoders[(clazz, envelope)] = decode
+    return decode
+
+
+def _define_struct(
+    clazz: Type[ResponseModel],
+    mapping_definition: ResponseMappingDefinition,
+    struct_name: str,
+) -> Type[msgspec.Struct]:
+    fields: Dict[str, Tuple[str, Any]] = {}
+    required: Dict[str, bool] = {}
+    converted: Dict[str, Callable[[Any], Any]] = {}
+    either: Dict[str, Tuple[str, ...]] = {}
+
+    properties = [(p, True) for p in mapping_definition.required_properties] + [
+        (p, False) for p in mapping_definition.optional_properties
+    ]
+    for prop, is_required in properties:
+        info: Optional[ExtractorInfo] = getattr(prop.extractor, "extractor_info", None)
+        if info is None:
+            raise TypeError(
+                f"Property {prop.raw_property_name} of {clazz.__name__} "
+                "uses an extractor that cannot be expressed as a struct field"
+            )
+        name = prop.model_property_name
+
+        if info.kind == "get_as_model":
+            type_ = Optional[_struct_name(info.model, info.mapping_definition)]
+        elif info.kind == "get_list_of_model":
+            type_ = Optional[List[_struct_name(info.model)]]
+        else:
+            type_ = Any
+            if info.kind in ("get_as", "get_with", "get_datetime"):
+                converted[name] = info.type_ if info.kind == "get_as" else info.mapper
+        fields[name] = (info.key, type_)
+        required[name] = is_required
+
+        if info.kind == "get_either":
+            either[name] = tuple(f"_{name}_{i}" for i in range(1, len(info.keys)))
+            for alternative, key in zip(either[name], info.keys[1:]):
+                fields[alternative] = (key, Any)
+                required[alternative] = False
+
+    return msgspec.defstruct(
+        struct_name,
+        [
+            (name, type_) if required[name] else (name, type_, None)
+            for name, (_, type_) in fields.items()
+        ],
+        namespace={
+            "__post_init__": _post_init(
+                converted,
+                either,
+                tuple(name for name, is_required in required.items() if is_required),
+            )
+        },
+        rename={name: key for name, (key, _) in fields.items()},
+        kw_only=True,
+        module=__name__,
+    )
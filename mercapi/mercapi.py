@@ -1,18 +1,50 @@
+import asyncio
 import random
 import uuid
-from typing import Optional, List
+from concurrent.futures import Executor
+from copy import copy
+from typing import (
+    Optional,
+    List,
+    Iterable,
+    AsyncIterator,
+    Tuple,
+    Mapping,
+    Union,
+    Callable,
+    Awaitable,
+    TypeVar,
+    FrozenSet,
+    Type,
+    TYPE_CHECKING,
+)
 
 import httpx
 from httpx._types import ProxiesTypes
-from ecdsa import SigningKey, NIST256p
 from httpx import Request
 
 from mercapi.mapping import map_to_class
-from mercapi.models import SearchResults, Item, Profile, Items
-from mercapi.models.base import ResponseModel
+from mercapi.mapping.interning import Interner
+from mercapi.models import SearchResults, SearchResultItem, Item, Profile, Items
+from mercapi.models.item import ItemRevalidation
+from mercapi.models.base import ResponseModel, RM
 from mercapi.models.shop import ShopProduct
-from mercapi.requests import SearchRequestData
+from mercapi.requests import SearchRequestData, Endpoint
 from mercapi.util import jwt
+from mercapi.util.dpop_pool import DPoPProofPool
+from mercapi.util.json_codec import JSONDecoder, JSONEncoder, get_json_backend
+from mercapi.util.cache import ResponseCache, TTLCache, MISSING
+from mercapi.util.concurrency import AdaptiveConcurrencyLimiter
+from mercapi.util.errors import RetryError
+from mercapi.util.rate_limit import RateLimiter
+from mercapi.util.retry import RetryPolicy
+from mercapi.util.singleflight import SingleFlight
+from mercapi.util.sqlite_cache import SQLiteResponseStore
+
+if TYPE_CHECKING:
+    import msgspec
+
+T = TypeVar("T")
 
 
 class Mercapi:
@@ -30,11 +62,45 @@ class Mercapi:
         *,
         proxies: Optional[ProxiesTypes] = None,
         user_agent: Optional[str] = None,
+        signing_backend: str = "cryptography",
+        offload_signing: bool = False,
+        signing_executor: Optional[Executor] = None,
+        dpop_pool_size: int = 0,
+        rate_limits: Optional[Mapping[Union[Endpoint, str], float]] = None,
+        rate_limit_burst: int = 1,
+        retry: Optional[RetryPolicy] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        coalesce_requests: bool = True,
+        cache: Optional[ResponseCache] = None,
+        response_store: Optional[SQLiteResponseStore] = None,
+        revalidation_cache_size: int = 10000,
+        lazy_models: bool = False,
+        compact_models: bool = False,
+        interner: Optional[Interner] = None,
+        json_decoder: Optional[JSONDecoder] = None,
+        json_encoder: Optional[JSONEncoder] = None,
     ):
         """initialize
 
         :param proxies: Once the proxy is configured, the IP address of the access source can be changed. (e.g. {"http://": "http://example.com:1234", "https://": "http://example.com:1234"})
         :param user_agent: User-Agent
+        :param signing_backend: library used for signing requests, one of `mercapi.util.jwt.SIGNING_BACKENDS` ("cryptography" or "ecdsa")
+        :param offload_signing: sign requests outside of the event loop, so that CPU-bound signing does not stall other in-flight requests
+        :param signing_executor: executor used for offloaded signing, event loop's default executor is used if not provided; implies `offload_signing`
+        :param dpop_pool_size: number of pre-signed DPoP proofs kept ready for every listing and profile registered with :func:`watch`, pooling is disabled if 0
+        :param rate_limits: maximum number of requests per second for each endpoint (e.g. {Endpoint.ITEM: 5, "entities:search": 1}), shared by all concurrent calls; endpoints not listed are not limited
+        :param rate_limit_burst: number of requests to a single endpoint allowed at once after a period of inactivity
+        :param retry: policy of retrying requests that failed with a transient error (e.g. 429 or 503 status), requests are not retried if not provided
+        :param concurrency_limiter: limiter adjusting the number of requests in flight to observed latency and throttling, the number is not limited if not provided
+        :param coalesce_requests: share a single request and its result between concurrent :func:`item`, :func:`profile`, :func:`items` and :func:`shop_product` calls with the same arguments
+        :param cache: cache of :func:`item`, :func:`profile`, :func:`items` and :func:`shop_product` results, results are not cached if not provided
+        :param response_store: persistent store of raw responses to GET requests, which can be shared between processes; responses are not stored if not provided
+        :param revalidation_cache_size: number of listings remembered by :func:`revalidate_item`
+        :param lazy_models: map nested models of results (e.g. `Item.seller`) only when they are accessed for the first time
+        :param compact_models: create results as compact variants of models, which keep their properties in `__slots__` instead of `__dict__` (see `mercapi.models.base.compact_model`)
+        :param interner: interner sharing instances of lookup models (e.g. `ItemCondition`) and repeated strings (e.g. statuses) between results, nothing is shared if not provided
+        :param json_decoder: function decoding response bodies, the fastest one of `mercapi.util.json_codec.JSON_BACKENDS` (orjson, msgspec or json) is used if not provided
+        :param json_encoder: function encoding request bodies, chosen in the same way as `json_decoder` if not provided
         """
         if not user_agent:
             user_agent = (
@@ -48,21 +114,268 @@ class Mercapi:
         }
 
         self._uuid = str(uuid.UUID(int=random.getrandbits(128)))
-        self._key = SigningKey.generate(NIST256p)
+        self._signer = jwt.create_signer(signing_backend, {"uuid": self._uuid})
+        self._offload_signing = offload_signing or signing_executor is not None
+        self._signing_executor = signing_executor
+        self._dpop_pool = None
+        self._dpop_pool_startup = None
+        self._dpop_pool_task = None
+        if dpop_pool_size > 0:
+            self._dpop_pool = DPoPProofPool(self._signer, size=dpop_pool_size)
+        self._rate_limiter = None
+        if rate_limits:
+            self._rate_limiter = RateLimiter(
+                {Endpoint(k).value: v for k, v in rate_limits.items()},
+                rate_limit_burst,
+            )
+        self._retry = retry
+        self._concurrency_limiter = concurrency_limiter
+        self._singleflight = SingleFlight() if coalesce_requests else None
+        self._cache = cache
+        self._response_store = response_store
+        self._item_checksums = TTLCache(revalidation_cache_size, float("inf"))
+        self._lazy_models = lazy_models
+        self._compact_models = compact_models
+        self._interner = interner
+        default_decoder, default_encoder = get_json_backend()
+        self._json_decoder = json_decoder or default_decoder
+        self._json_encoder = json_encoder or default_encoder
         self._client = httpx.AsyncClient(proxies=proxies)
         ResponseModel.set_mercapi(self)
 
     def _sign_request(self, request: Request) -> Request:
-        request.headers["DPoP"] = jwt.generate_dpop(
-            str(request.url),
-            request.method,
-            self._key,
-            {
-                "uuid": self._uuid,
-            },
-        )
+        request.headers["DPoP"] = self._signer.sign(str(request.url), request.method)
         return request
 
+    async def _send(self, request: Request) -> httpx.Response:
+        endpoint = Endpoint.of(request)
+        if (
+            self._response_store is None
+            or request.method != "GET"
+            or endpoint is None
+            or not self._response_store.stores(endpoint)
+        ):
+            return await self._send_with_retry(request)
+
+        loop = asyncio.get_running_loop()
+        url = str(request.url)
+        body = await loop.run_in_executor(None, self._response_store.get, url)
+        if body is not None:
+            return httpx.Response(200, content=body, request=request)
+
+        response = await self._send_with_retry(request)
+        if response.status_code == 200:
+            await loop.run_in_executor(
+                None, self._response_store.set, endpoint, url, response.content
+            )
+        return response
+
+    async def _send_with_retry(self, request: Request) -> httpx.Response:
+        if self._retry is None:
+            return await self._send_once(request)
+
+        attempt = 1
+        while True:
+            try:
+                response = await self._send_once(request)
+            except httpx.TransportError as exc:
+                if not self._retry.retry_transport_errors:
+                    raise
+                if attempt >= self._retry.max_attempts:
+                    raise RetryError(
+                        f"Request to {request.url} failed after {attempt} attempts"
+                    ) from exc
+                delay = self._retry.delay(attempt)
+            else:
+                if not self._retry.should_retry(response):
+                    return response
+                if attempt >= self._retry.max_attempts:
+                    raise RetryError(
+                        f"Request to {request.url} failed with status {response.status_code} after {attempt} attempts",
+                        response,
+                    )
+                delay = self._retry.delay(attempt, response)
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_once(self, request: Request) -> httpx.Response:
+        if self._rate_limiter is not None:
+            endpoint = Endpoint.of(request)
+            if endpoint is not None:
+                await self._rate_limiter.acquire(endpoint.value)
+
+        if self._concurrency_limiter is None:
+            return await self._sign_and_send(request)
+
+        started = await self._concurrency_limiter.acquire()
+        overloaded = False
+        try:
+            response = await self._sign_and_send(request)
+            overloaded = response.status_code in (429, 503)
+            return response
+        except httpx.TimeoutException:
+            overloaded = True
+            raise
+        finally:
+            self._concurrency_limiter.release(started, overloaded=overloaded)
+
+    async def _sign_and_send(self, request: Request) -> httpx.Response:
+        proof = None
+        if self._dpop_pool is not None:
+            await self.start()
+            proof = self._dpop_pool.get(request.method, str(request.url))
+
+        if proof is not None:
+            request.headers["DPoP"] = proof
+        elif self._offload_signing:
+            await asyncio.get_running_loop().run_in_executor(
+                self._signing_executor, self._sign_request, request
+            )
+        else:
+            self._sign_request(request)
+        return await self._client.send(request)
+
+    def watch(
+        self, *, item_ids: Iterable[str] = (), profile_ids: Iterable[str] = ()
+    ) -> None:
+        """Keep pre-signed DPoP proofs ready for fetching specified listings and profiles,
+        so that :func:`item` and :func:`profile` calls for them do not wait for signing.
+
+        Requires `dpop_pool_size` to be set during the instantiation.
+        Proofs are generated in the background task started by :func:`start`.
+
+        :param item_ids: ids of listings (items)
+        :param profile_ids: ids of sellers (profiles)
+        """
+        if self._dpop_pool is None:
+            raise ValueError(
+                "DPoP proof pool is disabled, set dpop_pool_size to use it"
+            )
+        for request in [self._item(i) for i in item_ids] + [
+            self._profile(i) for i in profile_ids
+        ]:
+            self._dpop_pool.register(request.method, str(request.url))
+
+    def unwatch(
+        self, *, item_ids: Iterable[str] = (), profile_ids: Iterable[str] = ()
+    ) -> None:
+        """Stop keeping pre-signed DPoP proofs for specified listings and profiles.
+
+        :param item_ids: ids of listings (items)
+        :param profile_ids: ids of sellers (profiles)
+        """
+        if self._dpop_pool is None:
+            return
+        for request in [self._item(i) for i in item_ids] + [
+            self._profile(i) for i in profile_ids
+        ]:
+            self._dpop_pool.unregister(request.method, str(request.url))
+
+    async def start(self) -> None:
+        """Start background tasks.
+
+        Proofs for requests registered with :func:`watch` are generated
+        before this method returns. Calling it is optional, background tasks
+        are started on the first request otherwise.
+
+        :raise: exception the background task has failed with, if any
+        """
+        if self._dpop_pool is None:
+            return
+        if self._dpop_pool_startup is None:
+            # created before the first await, so that concurrent first requests
+            # wait for the same startup instead of starting their own tasks
+            self._dpop_pool_startup = asyncio.ensure_future(self._start_dpop_pool())
+        await asyncio.shield(self._dpop_pool_startup)
+        if self._dpop_pool_task.done():
+            self._dpop_pool_task.result()
+
+    async def _start_dpop_pool(self) -> None:
+        await self._dpop_pool.refill(
+            offload=self._offload_signing, executor=self._signing_executor
+        )
+        self._dpop_pool_task = asyncio.ensure_future(
+            self._dpop_pool.run(
+                offload=self._offload_signing, executor=self._signing_executor
+            )
+        )
+
+    async def _fetch_json(self, request: Request) -> Optional[dict]:
+        res = await self._send(request)
+        if res.status_code == 404:
+            return None
+        return self._json_decoder(res.content)
+
+    def _map(
+        self,
+        body: dict,
+        clazz: Type[RM],
+        fields: Optional[Iterable[str]] = None,
+    ) -> RM:
+        return map_to_class(
+            body,
+            clazz,
+            fields=fields,
+            lazy=self._lazy_models,
+            compact=self._compact_models,
+            interner=self._interner,
+        )
+
+    async def _fetch_struct(
+        self,
+        request: Request,
+        clazz: Type[ResponseModel],
+        envelope: Optional[str] = None,
+    ) -> Optional["msgspec.Struct"]:
+        # msgspec is optional, so structs are imported only when used
+        from mercapi.mapping.structs import struct_decoder
+
+        res = await self._send(request)
+        if res.status_code == 404:
+            return None
+        return struct_decoder(clazz, envelope)(res.content)
+
+    async def _lookup(
+        self, endpoint: Endpoint, key: Tuple, fn: Callable[[], Awaitable[T]]
+    ) -> T:
+        cache = self._cache
+        if cache is not None and cache.caches(endpoint):
+            cached = cache.get(endpoint, key)
+            if cached is not MISSING:
+                return cached
+        else:
+            cache = None
+
+        if self._singleflight is None:
+            result = await fn()
+        else:
+            result = await self._singleflight.do((endpoint, *key), fn)
+
+        if cache is not None:
+            cache.set(endpoint, key, result)
+        return result
+
+    async def aclose(self) -> None:
+        """Stop background tasks and close the underlying HTTP client."""
+        if self._dpop_pool_startup is not None:
+            self._dpop_pool_startup.cancel()
+            await asyncio.gather(self._dpop_pool_startup, return_exceptions=True)
+            self._dpop_pool_startup = None
+        if self._dpop_pool_task is not None:
+            self._dpop_pool_task.cancel()
+            await asyncio.gather(self._dpop_pool_task, return_exceptions=True)
+            self._dpop_pool_task = None
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "Mercapi":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
     async def search(
         self,
         query: str,
@@ -81,7 +394,10 @@ class Mercapi:
         status: List[SearchRequestData.Status] = [],
         page_token: str = None,
         exclude: str = None,
-    ) -> SearchResults:
+        fields: Optional[Iterable[str]] = None,
+        raw: bool = False,
+        struct: bool = False,
+    ) -> Union[SearchResults, dict, "msgspec.Struct"]:
         """Perform basic search and return list of items and metadata.
         This method reflects the action of using search bar at the top of the website.
 
@@ -106,6 +422,9 @@ class Mercapi:
         :param status: filter results by listing statuses (販売状況)
         :param page_token: used for paging results, provided in the response data
         :param exclude: Exclude items matching to string (除外キーワード)
+        :param fields: names of search result (item) properties to parse, others are left as `None`; all are parsed if not provided
+        :param raw: return the decoded response body instead of a model
+        :param struct: decode the response straight into a struct equivalent to the model (see `mercapi.mapping.structs`), requires msgspec
         :return: List of search results (items) and metadata (e.g. total count)
         """
         request = SearchRequestData(
@@ -127,39 +446,263 @@ class Mercapi:
             ),
             page_token,
         )
-        res = await self._search_impl(request)
+        if raw:
+            res = await self._send(self._search(request))
+            return self._json_decoder(res.content)
+        if struct:
+            return await self._fetch_struct(self._search(request), SearchResults)
+        res = await self._search_impl(request, _projection(fields))
         res._request = request
         return res
 
-    async def _search_impl(self, request: SearchRequestData) -> SearchResults:
-        res = await self._client.send(self._search(request))
-        body = res.json()
-        res = map_to_class(body, SearchResults)
+    async def search_iter(
+        self,
+        query: str,
+        *,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+        **kwargs,
+    ) -> AsyncIterator[SearchResultItem]:
+        """Iterate over search results across all pages.
+
+        Accepts the same filtering and sorting parameters as :func:`~mercapi.Mercapi.search`,
+        except for `raw` and `struct`, as pages are iterated over as `SearchResults`.
+        With `prefetch` enabled the request for the next page is sent
+        while the items of the current page are being consumed.
+
+        :param query: string results should match (e.g. what you type in top search bar)
+        :param max_pages: stop after fetching this many pages, fetch all pages if `None`
+        :param prefetch: request the next page before the current one is fully consumed
+        :return: async iterator of search results (items)
+        """
+        for option in ("raw", "struct"):
+            if option in kwargs:
+                raise TypeError(f"search_iter() does not support the {option} option")
+        page = await self.search(query, **kwargs)
+        pages_fetched = 1
+        next_page = None
+        try:
+            while True:
+                has_next = page.meta.next_page_token != "" and (
+                    max_pages is None or pages_fetched < max_pages
+                )
+                if has_next:
+                    next_request = copy(page._request)
+                    next_request.page_token = page.meta.next_page_token
+                    next_page = self._search_impl(next_request, page._fields)
+                    if prefetch:
+                        next_page = asyncio.ensure_future(next_page)
+
+                for item in page.items:
+                    yield item
+
+                if not has_next:
+                    break
+                page, next_page = await next_page, None
+                pages_fetched += 1
+        finally:
+            if isinstance(next_page, asyncio.Future):
+                next_page.cancel()
+            elif next_page is not None:
+                next_page.close()
+
+    async def _search_impl(
+        self, request: SearchRequestData, fields: Optional[FrozenSet[str]] = None
+    ) -> SearchResults:
+        res = await self._send(self._search(request))
+        body = self._json_decoder(res.content)
+        if fields is None:
+            res = self._map(body, SearchResults)
+        else:
+            res = self._map(body, SearchResults, fields=("meta",))
+            res.items = [
+                self._map(i, SearchResultItem, fields=fields)
+                for i in body.get("items") or []
+            ]
         res._request = request
+        res._fields = fields
         return res
 
     def _search(self, search_request_data: SearchRequestData) -> Request:
         req = Request(
             "POST",
             "https://api.mercari.jp/v2/entities:search",
-            json=search_request_data.data,
-            headers=self._headers,
+            content=self._json_encoder(search_request_data.data),
+            headers={**self._headers, "Content-Type": "application/json"},
         )
-        return self._sign_request(req)
+        return req
 
-    async def item(self, id_: str) -> Optional[Item]:
+    async def item(
+        self,
+        id_: str,
+        *,
+        fields: Optional[Iterable[str]] = None,
+        raw: bool = False,
+        struct: bool = False,
+    ) -> Union[Item, dict, "msgspec.Struct", None]:
         """Fetch details of a single listing (item).
         This method reflects the action of loading single item view.
 
         :param id_: id of a listing (item)
+        :param fields: names of listing (item) properties to parse, others are left as `None`; all are parsed if not provided
+        :param raw: return the decoded response body instead of a model, bypassing the cache
+        :param struct: decode the response straight into a struct equivalent to the model (see `mercapi.mapping.structs`), bypassing the cache; requires msgspec
         :return: all available listing (item) properties
         """
-        res = await self._client.send(self._item(id_))
-        if res.status_code == 404:
+        if raw:
+            return await self._fetch_json(self._item(id_))
+        if struct:
+            return await self._fetch_struct(self._item(id_), Item, "data")
+        fields = _projection(fields)
+        return await self._lookup(
+            Endpoint.ITEM,
+            _lookup_key(id_, fields),
+            lambda: self._item_impl(id_, fields),
+        )
+
+    async def _item_impl(
+        self, id_: str, fields: Optional[FrozenSet[str]] = None
+    ) -> Optional[Item]:
+        body = await self._fetch_json(self._item(id_))
+        if body is None:
             return None
 
-        body = res.json()
-        return map_to_class(body["data"], Item)
+        return self._map(body["data"], Item, fields=fields)
+
+    async def items_by_ids(
+        self, ids: Iterable[str], *, concurrency: int = 10
+    ) -> List[Optional[Item]]:
+        """Fetch details of many listings (items) concurrently.
+
+        At most `concurrency` requests are in flight at any given time.
+        Results are returned in the same order as `ids`.
+
+        :param ids: ids of listings (items)
+        :param concurrency: maximum number of simultaneous requests
+        :return: list of listings, `None` in place of listings that were not found
+        """
+        return await self._collect_concurrently(ids, self.item, concurrency)
+
+    async def iter_items_by_ids(
+        self, ids: Iterable[str], *, concurrency: int = 10
+    ) -> AsyncIterator[Tuple[str, Optional[Item]]]:
+        """Fetch details of many listings (items) concurrently,
+        yielding them as soon as they are available.
+
+        At most `concurrency` requests are in flight at any given time.
+        Results are yielded in completion order, not in the order of `ids`.
+
+        :param ids: ids of listings (items)
+        :param concurrency: maximum number of simultaneous requests
+        :return: async iterator of `(id, item)` pairs, `item` is `None` if the listing was not found
+        """
+        async for result in self._iter_concurrently(ids, self.item, concurrency):
+            yield result
+
+    async def revalidate_item(self, id_: str) -> ItemRevalidation:
+        """Fetch details of a single listing (item), skipping parsing of the response
+        if the listing has not changed since it was last revalidated.
+
+        Listings are compared using their `checksum`. Unchanged listing is
+        returned as the same object as before, with `unchanged` flag set.
+        Up to `revalidation_cache_size` most recently revalidated listings are remembered.
+
+        :param id_: id of a listing (item)
+        :return: listing (`None` if it was not found) and the flag
+        """
+        if self._singleflight is None:
+            return await self._revalidate_item_impl(id_)
+        return await self._singleflight.do(
+            (Endpoint.ITEM, id_, "revalidate"),
+            lambda: self._revalidate_item_impl(id_),
+        )
+
+    async def _revalidate_item_impl(self, id_: str) -> ItemRevalidation:
+        body = await self._fetch_json(self._item(id_))
+        if body is None:
+            self._item_checksums.delete(id_)
+            return ItemRevalidation(None, False)
+
+        data = body["data"]
+        checksum = data.get("checksum")
+        known = self._item_checksums.get(id_)
+        if checksum is not None and known is not MISSING and known[0] == checksum:
+            return ItemRevalidation(known[1], True)
+
+        item = self._map(data, Item)
+        if checksum is not None:
+            self._item_checksums.set(id_, (checksum, item))
+        return ItemRevalidation(item, False)
+
+    async def revalidate_items(
+        self, ids: Iterable[str], *, concurrency: int = 10
+    ) -> List[ItemRevalidation]:
+        """Revalidate many listings (items) concurrently.
+
+        Bulk variant of :func:`revalidate_item`, results are returned in the same order as `ids`.
+
+        :param ids: ids of listings (items)
+        :param concurrency: maximum number of simultaneous requests
+        :return: list of listings with `unchanged` flags
+        """
+        return await self._collect_concurrently(ids, self.revalidate_item, concurrency)
+
+    async def _collect_concurrently(
+        self,
+        keys: Iterable[str],
+        fn: Callable[[str], Awaitable[T]],
+        concurrency: int,
+    ) -> List[T]:
+        keys = list(keys)
+        results: List[T] = [None] * len(keys)
+        positions = {}
+        for i, key in enumerate(keys):
+            positions.setdefault(key, []).append(i)
+
+        async for key, result in self._iter_concurrently(
+            positions.keys(), fn, concurrency
+        ):
+            for i in positions[key]:
+                results[i] = result
+        return results
+
+    async def _iter_concurrently(
+        self,
+        keys: Iterable[str],
+        fn: Callable[[str], Awaitable[T]],
+        concurrency: int,
+    ) -> AsyncIterator[Tuple[str, T]]:
+        if concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+
+        async def call(key: str) -> Tuple[str, T]:
+            return key, await fn(key)
+
+        pending_keys = iter(keys)
+        in_flight = set()
+        done = set()
+        try:
+            for key in pending_keys:
+                in_flight.add(asyncio.ensure_future(call(key)))
+                if len(in_flight) >= concurrency:
+                    break
+
+            while in_flight:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                while done:
+                    task = done.pop()
+                    next_key = next(pending_keys, None)
+                    if next_key is not None:
+                        in_flight.add(asyncio.ensure_future(call(next_key)))
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            # retrieve results of unfinished and unread tasks,
+            # so that their exceptions are not reported as unhandled
+            await asyncio.gather(*in_flight, *done, return_exceptions=True)
 
     def _item(self, id_: str) -> Request:
         req = Request(
@@ -168,21 +711,36 @@ class Mercapi:
             params={"id": id_, "include_auction": "true"},
             headers=self._headers,
         )
-        return self._sign_request(req)
+        return req
 
-    async def profile(self, id_: str) -> Optional[Profile]:
+    async def profile(
+        self, id_: str, *, fields: Optional[Iterable[str]] = None, raw: bool = False
+    ) -> Union[Profile, dict, None]:
         """Fetch details of a single seller.
         This method reflects the action of loading single seller profile view.
 
         :param id_: id of a seller (profile)
+        :param fields: names of seller (profile) properties to parse, others are left as `None`; all are parsed if not provided
+        :param raw: return the decoded response body instead of a model, bypassing the cache
         :return: all available seller (profile) properties
         """
-        res = await self._client.send(self._profile(id_))
-        if res.status_code == 404:
+        if raw:
+            return await self._fetch_json(self._profile(id_))
+        fields = _projection(fields)
+        return await self._lookup(
+            Endpoint.PROFILE,
+            _lookup_key(id_, fields),
+            lambda: self._profile_impl(id_, fields),
+        )
+
+    async def _profile_impl(
+        self, id_: str, fields: Optional[FrozenSet[str]] = None
+    ) -> Optional[Profile]:
+        body = await self._fetch_json(self._profile(id_))
+        if body is None:
             return None
 
-        body = res.json()
-        return map_to_class(body["data"], Profile)
+        return self._map(body["data"], Profile, fields=fields)
 
     def _profile(self, id_: str) -> Request:
         req = Request(
@@ -191,21 +749,30 @@ class Mercapi:
             params={"user_id": id_, "_user_format": "profile"},
             headers=self._headers,
         )
-        return self._sign_request(req)
+        return req
 
-    async def items(self, profile_id: str) -> Optional[Items]:
+    async def items(
+        self, profile_id: str, *, raw: bool = False
+    ) -> Union[Items, dict, None]:
         """Fetch all items sold by specified seller.
         This method reflects the action of loading single seller profile view.
 
         :param profile_id: ID of a seller
+        :param raw: return the decoded response body instead of a model, bypassing the cache
         :return: list of items sold by specified seller
         """
-        res = await self._client.send(self._items(profile_id))
-        if res.status_code == 404:
+        if raw:
+            return await self._fetch_json(self._items(profile_id))
+        return await self._lookup(
+            Endpoint.ITEMS, (profile_id,), lambda: self._items_impl(profile_id)
+        )
+
+    async def _items_impl(self, profile_id: str) -> Optional[Items]:
+        body = await self._fetch_json(self._items(profile_id))
+        if body is None:
             return None
 
-        body = res.json()
-        return map_to_class(body, Items)
+        return self._map(body, Items)
 
     def _items(self, profile_id: str) -> Request:
         req = Request(
@@ -218,23 +785,49 @@ class Mercapi:
             },
             headers=self._headers,
         )
-        return self._sign_request(req)
+        return req
 
-    async def shop_product(self, product_id: str, view: str = "FULL", image_type: str = "JPEG") -> Optional[ShopProduct]:
+    async def shop_product(
+        self,
+        product_id: str,
+        view: str = "FULL",
+        image_type: str = "JPEG",
+        *,
+        raw: bool = False,
+        struct: bool = False,
+    ) -> Union[ShopProduct, dict, "msgspec.Struct", None]:
         """Fetch details of a single shop product listing.
         This method reflects the action of loading a shop product view.
 
         :param product_id: id of a shop product
         :param view: view type (default: "FULL")
         :param image_type: image type (default: "JPEG")
+        :param raw: return the decoded response body instead of a model, bypassing the cache
+        :param struct: decode the response straight into a struct equivalent to the model (see `mercapi.mapping.structs`), bypassing the cache; requires msgspec
         :return: all available shop product properties
         """
-        res = await self._client.send(self._shop_product(product_id, view, image_type))
-        if res.status_code == 404:
+        if raw:
+            return await self._fetch_json(
+                self._shop_product(product_id, view, image_type)
+            )
+        if struct:
+            return await self._fetch_struct(
+                self._shop_product(product_id, view, image_type), ShopProduct
+            )
+        return await self._lookup(
+            Endpoint.SHOP_PRODUCT,
+            (product_id, view, image_type),
+            lambda: self._shop_product_impl(product_id, view, image_type),
+        )
+
+    async def _shop_product_impl(
+        self, product_id: str, view: str, image_type: str
+    ) -> Optional[ShopProduct]:
+        body = await self._fetch_json(self._shop_product(product_id, view, image_type))
+        if body is None:
             return None
 
-        body = res.json()
-        return map_to_class(body, ShopProduct)
+        return self._map(body, ShopProduct)
 
     def _shop_product(self, product_id: str, view: str = "FULL", image_type: str = "JPEG") -> Request:
         req = Request(
@@ -243,4 +836,13 @@ class Mercapi:
             params={"view": view, "imageType": image_type},
             headers=self._headers,
         )
-        return self._sign_request(req)
+        return req
+
+
+def _projection(fields: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    return frozenset(fields) if fields is not None else None
+
+
+def _lookup_key(id_: str, fields: Optional[FrozenSet[str]]) -> Tuple:
+    # projected results are cached apart from complete ones
+    return (id_,) if fields is None else (id_, fields)
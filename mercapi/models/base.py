@@ -1,5 +1,7 @@
+import dataclasses
 from datetime import datetime
 from typing import (
+    Dict,
     NamedTuple,
     Callable,
     List,
@@ -26,6 +28,9 @@ class ResponseProperty(NamedTuple):
 
 class ResponseModel:
 
+    # lets compact variants of models (see `compact_model`) go without __dict__
+    __slots__ = ()
+
     _mercapi: "Mercapi"
 
     @classmethod
@@ -33,6 +38,45 @@ class ResponseModel:
         cls._mercapi = mercapi
 
 
+_compact_models: Dict[type, type] = {}
+
+
+def compact_model(clazz: Type[RM]) -> Type[RM]:
+    """Get a variant of a model class keeping its properties in `__slots__`.
+
+    Instances of the variant have no per-instance `__dict__`, which makes them
+    considerably smaller. The variant has the same properties and methods,
+    but it is a separate class named after the model with "Compact" prefix,
+    not a subclass of the model. New attributes cannot be set on its instances.
+    """
+    compact = _compact_models.get(clazz)
+    if compact is None:
+        field_names = tuple(f.name for f in dataclasses.fields(clazz))
+        namespace = {
+            k: v
+            for k, v in clazz.__dict__.items()
+            # defaults of fields are kept by __init__, class attributes would clash with slots
+            if k not in field_names and k not in ("__dict__", "__weakref__")
+        }
+        namespace["__slots__"] = field_names
+        namespace["__qualname__"] = f"Compact{clazz.__qualname__}"
+        # variants cannot be looked up by name, so they are pickled by their model
+        namespace["__reduce__"] = lambda self: (
+            _restore_compact_model,
+            (clazz, {n: getattr(self, n) for n in field_names if hasattr(self, n)}),
+        )
+        compact = type(clazz)(f"Compact{clazz.__name__}", clazz.__bases__, namespace)
+        _compact_models[clazz] = compact
+    return compact
+
+
+def _restore_compact_model(clazz: Type[RM], values: Dict[str, Any]) -> RM:
+    obj = object.__new__(compact_model(clazz))
+    for name, value in values.items():
+        setattr(obj, name, value)
+    return obj
+
+
 class Extractors:
     """
     Collection of HOFs for parsing API responses in the most common ways.
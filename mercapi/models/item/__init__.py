@@ -1 +1,2 @@
 from .item import Item
+from .revalidation import ItemRevalidation
@@ -0,0 +1,11 @@
+from typing import NamedTuple, Optional
+
+from mercapi.models.item.item import Item
+
+
+class ItemRevalidation(NamedTuple):
+    item: Optional[Item]
+    """Listing, `None` if it was not found"""
+
+    unchanged: bool
+    """Listing has not changed since it was last revalidated, `item` is the object returned back then"""
@@ -2,3 +2,4 @@ from .data import PhotoUri, Auction, Shop
 from .meta import Meta
 from .search_result_item import SearchResultItem
 from .search_results import SearchResults
+from .columns import SearchResultColumns
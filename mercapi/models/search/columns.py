@@ -0,0 +1,301 @@
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING, Union
+
+from mercapi.util.errors import ParseAPIResponseError
+
+if TYPE_CHECKING:
+    import numpy
+    from mercapi.models.search.search_result_item import SearchResultItem
+
+NULL = -1
+"""Value of numeric columns for properties missing in a result"""
+
+INT_COLUMNS = (
+    "price",
+    "created",
+    "updated",
+    "item_condition_id",
+    "shipping_payer_id",
+    "shipping_method_id",
+    "category_id",
+    "brand_id",
+)
+"""Names of int64 columns"""
+
+
+def _int64() -> array:
+    return array("q")
+
+
+def _int_or_null(value: Any) -> int:
+    return NULL if value is None else int(value)
+
+
+def _epoch(value: Union[datetime, int]) -> int:
+    return int(value.timestamp()) if isinstance(value, datetime) else value
+
+
+@dataclass
+class SearchResultColumns:
+    """Search results stored as parallel columns, one entry per result,
+    instead of a list of `SearchResultItem` objects.
+
+    Numeric properties are kept in `array.array` columns of int64
+    (`created` and `updated` as epoch seconds), set to `NULL` if missing.
+    `status` holds codes of statuses listed in `statuses`, `is_no_price` holds 0 or 1.
+    Ids of results and sellers are kept as lists of strings.
+
+    Columns of many pages can be accumulated with :func:`extend` and
+    converted to NumPy arrays with :func:`to_numpy` without copying.
+    Results can be filtered and sorted with NumPy as well, see :func:`filter`
+    and :func:`sort`.
+    """
+
+    id_: List[str] = field(default_factory=list)
+    seller_id: List[Optional[str]] = field(default_factory=list)
+    price: array = field(default_factory=_int64)
+    created: array = field(default_factory=_int64)
+    updated: array = field(default_factory=_int64)
+    item_condition_id: array = field(default_factory=_int64)
+    shipping_payer_id: array = field(default_factory=_int64)
+    shipping_method_id: array = field(default_factory=_int64)
+    category_id: array = field(default_factory=_int64)
+    brand_id: array = field(default_factory=_int64)
+    status: array = field(default_factory=lambda: array("h"))
+    is_no_price: array = field(default_factory=lambda: array("b"))
+    statuses: List[str] = field(default_factory=list)
+    _status_codes: Dict[Optional[str], int] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self._status_codes.update((s, i) for i, s in enumerate(self.statuses))
+
+    @classmethod
+    def from_items(cls, items: Iterable["SearchResultItem"]) -> "SearchResultColumns":
+        """Build columns of mapped search results.
+
+        :param items: search results, e.g. `SearchResults.items`
+        """
+        columns = cls()
+        for item in items:
+            columns._append(
+                item.id_,
+                item.seller_id,
+                item.status,
+                item.is_no_price,
+                _int_or_null(item.price),
+                int(item.created.timestamp()) if item.created is not None else NULL,
+                int(item.updated.timestamp()) if item.updated is not None else NULL,
+                _int_or_null(item.item_condition_id),
+                _int_or_null(item.shipping_payer_id),
+                _int_or_null(item.shipping_method_id),
+                _int_or_null(item.category_id),
+                _int_or_null(item.item_brand.id_) if item.item_brand else NULL,
+            )
+        return columns
+
+    @classmethod
+    def from_response(cls, items: Iterable[dict]) -> "SearchResultColumns":
+        """Build columns straight from search results in the API response,
+        without mapping them to `SearchResultItem` objects.
+
+        :param items: response objects of search results, e.g. `items` of a search in raw mode
+        """
+        columns = cls()
+        for item in items:
+            try:
+                brand = item.get("itemBrand")
+                columns._append(
+                    item["id"],
+                    item.get("sellerId"),
+                    item.get("status"),
+                    item.get("isNoPrice"),
+                    int(item["price"]),
+                    _int_or_null(item.get("created")),
+                    _int_or_null(item.get("updated")),
+                    _int_or_null(item.get("itemConditionId")),
+                    _int_or_null(item.get("shippingPayerId")),
+                    _int_or_null(item.get("shippingMethodId")),
+                    _int_or_null(item.get("categoryId")),
+                    _int_or_null(brand.get("id")) if brand else NULL,
+                )
+            except Exception as exc:
+                raise ParseAPIResponseError(
+                    "Failed to retrieve search result columns from the response"
+                ) from exc
+        return columns
+
+    def _append(
+        self,
+        id_: str,
+        seller_id: Optional[str],
+        status: Optional[str],
+        is_no_price: Optional[bool],
+        *ints: int,
+    ) -> None:
+        for name, value in zip(INT_COLUMNS, ints):
+            getattr(self, name).append(value)
+        self.id_.append(id_)
+        self.seller_id.append(seller_id)
+        self.status.append(self.status_code(status))
+        self.is_no_price.append(1 if is_no_price else 0)
+
+    def status_code(self, status: Optional[str]) -> int:
+        """Get the code of a status in the `status` column, adding it to `statuses` if new.
+
+        :param status: status of a result (e.g. "ITEM_STATUS_ON_SALE"), `None` if missing
+        """
+        code = self._status_codes.get(status)
+        if code is None:
+            if status is None:
+                return NULL
+            code = self._status_codes[status] = len(self.statuses)
+            self.statuses.append(status)
+        return code
+
+    def extend(self, other: "SearchResultColumns") -> None:
+        """Append columns of other results (e.g. the next page) to these ones."""
+        for name in INT_COLUMNS + ("id_", "seller_id", "is_no_price"):
+            getattr(self, name).extend(getattr(other, name))
+        codes = [self.status_code(s) for s in other.statuses]
+        if codes == list(range(len(codes))):
+            self.status.extend(other.status)
+        else:
+            self.status.extend(codes[c] if c != NULL else NULL for c in other.status)
+
+    def to_numpy(self) -> Dict[str, "numpy.ndarray"]:
+        """Get columns as NumPy arrays, requires `numpy` to be installed.
+
+        Numeric columns are views of the arrays held by this object, they are
+        not copied. These arrays cannot grow while the views exist, so columns
+        should not be extended afterwards (copy the views first if needed).
+
+        :return: arrays for column names, ids are arrays of Python objects
+        """
+        import numpy
+
+        arrays = self._numeric_arrays()
+        arrays["id_"] = numpy.array(self.id_, dtype=object)
+        arrays["seller_id"] = numpy.array(self.seller_id, dtype=object)
+        return arrays
+
+    def _numeric_arrays(self) -> Dict[str, "numpy.ndarray"]:
+        import numpy
+
+        arrays = {
+            name: numpy.frombuffer(getattr(self, name), dtype=numpy.int64)
+            for name in INT_COLUMNS
+        }
+        arrays["status"] = numpy.frombuffer(self.status, dtype=numpy.int16)
+        arrays["is_no_price"] = numpy.frombuffer(self.is_no_price, dtype=numpy.int8)
+        return arrays
+
+    def mask(
+        self,
+        *,
+        price_min: Optional[int] = None,
+        price_max: Optional[int] = None,
+        created_after: Union[datetime, int, None] = None,
+        created_before: Union[datetime, int, None] = None,
+        statuses: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[int]] = None,
+        brands: Optional[Iterable[int]] = None,
+        is_no_price: Optional[bool] = None,
+    ) -> "numpy.ndarray":
+        """Evaluate predicates over all results at once, requires `numpy` to be installed.
+
+        Results matching all given predicates are selected, predicates not given are ignored.
+        Results missing a filtered property do not match.
+
+        :param price_min: minimum price, inclusive
+        :param price_max: maximum price, inclusive
+        :param created_after: minimum creation time, inclusive, as datetime or epoch seconds
+        :param created_before: maximum creation time, exclusive, as datetime or epoch seconds
+        :param statuses: statuses of results (e.g. "ITEM_STATUS_ON_SALE")
+        :param categories: category ids
+        :param brands: brand ids
+        :param is_no_price: whether results have no price
+        :return: boolean array with an entry for every result
+        """
+        import numpy
+
+        arrays = self._numeric_arrays()
+        mask = numpy.ones(len(self), dtype=bool)
+        if price_min is not None:
+            mask &= arrays["price"] >= price_min
+        if price_max is not None:
+            mask &= (arrays["price"] <= price_max) & (arrays["price"] != NULL)
+        if created_after is not None:
+            mask &= arrays["created"] >= _epoch(created_after)
+        if created_before is not None:
+            mask &= (arrays["created"] < _epoch(created_before)) & (
+                arrays["created"] != NULL
+            )
+        if statuses is not None:
+            codes = [self._status_codes[s] for s in statuses if s in self._status_codes]
+            mask &= numpy.isin(arrays["status"], codes)
+        if categories is not None:
+            mask &= numpy.isin(arrays["category_id"], list(categories))
+        if brands is not None:
+            mask &= numpy.isin(arrays["brand_id"], list(brands))
+        if is_no_price is not None:
+            mask &= arrays["is_no_price"] == int(is_no_price)
+        return mask
+
+    def filter(self, **predicates: Any) -> "SearchResultColumns":
+        """Get results matching predicates, see :func:`mask` for the available ones."""
+        return self.take(self.mask(**predicates))
+
+    def argsort(self, by: str = "created", descending: bool = False) -> "numpy.ndarray":
+        """Get positions of results in the order of a numeric column, requires `numpy` to be installed.
+
+        The sort is stable: results with equal values keep their relative order,
+        in both directions. Missing values (`NULL`) come first in ascending order
+        and last in descending order.
+
+        :param by: name of the column, one of `INT_COLUMNS`
+        :param descending: whether to sort from the highest value
+        """
+        import numpy
+
+        if by not in INT_COLUMNS:
+            raise ValueError(
+                f"Cannot sort by {by}, expected one of: {', '.join(INT_COLUMNS)}"
+            )
+        values = self._numeric_arrays()[by]
+        return numpy.argsort(-values if descending else values, kind="stable")
+
+    def sort(
+        self, by: str = "created", descending: bool = False
+    ) -> "SearchResultColumns":
+        """Get results in the order of a numeric column, see :func:`argsort`."""
+        return self.take(self.argsort(by, descending))
+
+    def take(self, indices: Any) -> "SearchResultColumns":
+        """Get results at given positions, requires `numpy` to be installed.
+
+        :param indices: positions of results or boolean mask of them (e.g. from :func:`mask`)
+        """
+        import numpy
+
+        indices = numpy.asarray(indices)
+        if indices.dtype == bool:
+            indices = numpy.flatnonzero(indices)
+        else:
+            indices = indices.astype(numpy.intp, copy=False)
+        arrays = self._numeric_arrays()
+        positions = indices.tolist()
+        columns = SearchResultColumns(
+            id_=[self.id_[i] for i in positions],
+            seller_id=[self.seller_id[i] for i in positions],
+            statuses=list(self.statuses),
+        )
+        for name in INT_COLUMNS + ("status", "is_no_price"):
+            getattr(columns, name).frombytes(arrays[name][indices].tobytes())
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.id_)
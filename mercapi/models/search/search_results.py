@@ -1,9 +1,10 @@
 from copy import copy
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional, FrozenSet
 
 from mercapi.models.base import ResponseModel
 from mercapi.models.search import SearchResultItem, Meta
+from mercapi.models.search.columns import SearchResultColumns
 from mercapi.requests import SearchRequestData
 from mercapi.util.errors import IncorrectRequestError
 
@@ -13,6 +14,7 @@ class SearchResults(ResponseModel):
     meta: Meta
     items: List[SearchResultItem]
     _request: SearchRequestData = field(init=False, compare=False, repr=False)
+    _fields: Optional[FrozenSet[str]] = field(init=False, compare=False, repr=False)
 
     async def next_page(self) -> "SearchResults":
         if self.meta.next_page_token == "":
@@ -21,7 +23,7 @@ class SearchResults(ResponseModel):
             )
         new_request = copy(self._request)
         new_request.page_token = self.meta.next_page_token
-        return await self._mercapi._search_impl(new_request)
+        return await self._mercapi._search_impl(new_request, self._fields)
 
     async def prev_page(self) -> "SearchResults":
         if self.meta.prev_page_token == "":
@@ -30,4 +32,11 @@ class SearchResults(ResponseModel):
             )
         new_request = copy(self._request)
         new_request.page_token = self.meta.prev_page_token
-        return await self._mercapi._search_impl(new_request)
+        return await self._mercapi._search_impl(new_request, self._fields)
+
+    def to_columns(self) -> SearchResultColumns:
+        """Get results of this page as parallel columns, see :class:`SearchResultColumns`.
+
+        Columns of many pages can be accumulated with `SearchResultColumns.extend`.
+        """
+        return SearchResultColumns.from_items(self.items)
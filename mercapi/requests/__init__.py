@@ -1,2 +1,3 @@
 from .base import RequestData
+from .endpoint import Endpoint
 from .search import SearchRequestData
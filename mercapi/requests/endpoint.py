@@ -0,0 +1,33 @@
+from enum import Enum
+from typing import Optional
+
+from httpx import Request
+
+
+class Endpoint(str, Enum):
+    """Mercari API endpoints used by the client.
+
+    Wherever an endpoint is expected in `Mercapi` configuration,
+    either a member or its string value can be used.
+    """
+
+    SEARCH = "entities:search"
+    ITEM = "items/get"
+    PROFILE = "users/get_profile"
+    ITEMS = "items/get_items"
+    SHOP_PRODUCT = "shops/products"
+
+    @classmethod
+    def of(cls, request: Request) -> Optional["Endpoint"]:
+        path = request.url.path
+        if path == "/v2/entities:search":
+            return cls.SEARCH
+        if path == "/items/get":
+            return cls.ITEM
+        if path == "/users/get_profile":
+            return cls.PROFILE
+        if path == "/items/get_items":
+            return cls.ITEMS
+        if path.startswith("/v1/marketplaces/shops/products/"):
+            return cls.SHOP_PRODUCT
+        return None
@@ -0,0 +1,195 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, Hashable, Mapping, NamedTuple, Optional, Tuple, Union
+
+from mercapi.requests import Endpoint
+
+MISSING = object()
+"""Returned by caches on a miss, as `None` may be a valid cached value."""
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache:
+    """In-memory cache with a bounded number of entries.
+
+    Entries expire after their time to live; when the cache is full,
+    the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """initialize
+
+        :param maxsize: maximum number of entries
+        :param ttl: default time to live of entries in seconds
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Get a value from the cache.
+
+        :return: cached value or `MISSING`
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires > monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+            del self._entries[key]
+        self._misses += 1
+        return MISSING
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Put a value in the cache.
+
+        :param ttl: time to live of the entry in seconds, default one is used if not provided
+        """
+        self._entries[key] = (monotonic() + (self._ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._misses, self._evictions, len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """Cache of mapped API responses with a separate time to live for every endpoint.
+
+    Cached objects are shared between all callers requesting them,
+    they should be treated as read-only.
+
+    With `negative_ttl` set, lookups of listings, profiles and shop products
+    that were not found (`None` results) are cached as well. They are kept
+    apart from found ones, with their own time to live, size and counters.
+    """
+
+    DEFAULT_TTL: Mapping[str, float] = {
+        Endpoint.ITEM.value: 60.0,
+        Endpoint.PROFILE.value: 300.0,
+        Endpoint.ITEMS.value: 60.0,
+        Endpoint.SHOP_PRODUCT.value: 60.0,
+    }
+    """Time to live of cached responses in seconds, for every cached endpoint"""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[Mapping[Union[Endpoint, str], float]] = None,
+        *,
+        negative_ttl: Optional[float] = None,
+        negative_maxsize: int = 4096,
+    ):
+        """initialize
+
+        :param maxsize: maximum number of cached responses
+        :param ttl: time to live of cached responses in seconds for endpoints (see `mercapi.requests.Endpoint`), endpoints not listed are not cached; `DEFAULT_TTL` is used if not provided
+        :param negative_ttl: time to live of not found results in seconds, not found results are not cached if not provided
+        :param negative_maxsize: maximum number of cached not found results
+        """
+        if ttl is None:
+            ttl = self.DEFAULT_TTL
+        self._ttl: Dict[str, float] = {Endpoint(k).value: v for k, v in ttl.items()}
+        self._entries = TTLCache(maxsize, 0)
+        self._negative = None
+        if negative_ttl:
+            self._negative = TTLCache(negative_maxsize, negative_ttl)
+        self._stats: Dict[str, Tuple[int, int]] = {}
+
+    def caches(self, endpoint: Union[Endpoint, str]) -> bool:
+        return Endpoint(endpoint).value in self._ttl
+
+    def get(self, endpoint: Union[Endpoint, str], key: Hashable) -> Any:
+        """Get a cached response.
+
+        :param endpoint: endpoint the response comes from
+        :param key: arguments identifying the response (e.g. listing id)
+        :return: cached response, `None` for a cached not found result or `MISSING`
+        """
+        endpoint = Endpoint(endpoint).value
+        value = self._entries.get((endpoint, key))
+        if value is MISSING and self._negative is not None:
+            value = self._negative.get((endpoint, key))
+        hits, misses = self._stats.get(endpoint, (0, 0))
+        if value is MISSING:
+            self._stats[endpoint] = (hits, misses + 1)
+        else:
+            self._stats[endpoint] = (hits + 1, misses)
+        return value
+
+    def set(self, endpoint: Union[Endpoint, str], key: Hashable, value: Any) -> None:
+        """Cache a response.
+
+        :param endpoint: endpoint the response comes from
+        :param key: arguments identifying the response (e.g. listing id)
+        :param value: response, `None` if nothing was found
+        """
+        endpoint = Endpoint(endpoint).value
+        ttl = self._ttl.get(endpoint)
+        if ttl is None:
+            return
+        if value is not None:
+            self._entries.set((endpoint, key), value, ttl)
+            if self._negative is not None:
+                self._negative.delete((endpoint, key))
+        elif self._negative is not None:
+            self._negative.set((endpoint, key), None)
+
+    def invalidate(self, endpoint: Union[Endpoint, str], key: Hashable) -> None:
+        self._entries.delete((Endpoint(endpoint).value, key))
+        if self._negative is not None:
+            self._negative.delete((Endpoint(endpoint).value, key))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self._negative is not None:
+            self._negative.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters of lookups of found results."""
+        return self._entries.stats
+
+    @property
+    def negative_stats(self) -> Optional[CacheStats]:
+        """Counters of lookups of not found results, performed after a miss
+        of found ones. `None` if not found results are not cached."""
+        return self._negative.stats if self._negative is not None else None
+
+    def endpoint_stats(self, endpoint: Union[Endpoint, str]) -> Tuple[int, int]:
+        """Counters of lookups of a single endpoint.
+
+        :return: number of hits and misses
+        """
+        return self._stats.get(Endpoint(endpoint).value, (0, 0))
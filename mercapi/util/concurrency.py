@@ -0,0 +1,118 @@
+import asyncio
+from collections import deque
+from time import monotonic
+from typing import Deque, Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of requests in flight, adjusting the limit
+    to the observed behaviour of the API (AIMD).
+
+    While latency stays close to the lowest latency observed, the limit grows
+    by `increase` per full window of requests (additive increase). On overload
+    signals - throttling responses, timeouts or latency exceeding the baseline
+    `latency_tolerance` times - the limit is multiplied by `decrease_factor`
+    (multiplicative decrease). Only requests started after the last decrease
+    can trigger another one, so a single burst of failures shrinks the limit once.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 128,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        """initialize
+
+        :param initial_limit: number of requests allowed in flight at the start
+        :param min_limit: lower bound of the limit
+        :param max_limit: upper bound of the limit
+        :param increase: growth of the limit per full window of successful requests
+        :param decrease_factor: factor the limit is multiplied by on overload
+        :param latency_tolerance: latency exceeding the baseline this many times is considered an overload
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._increase = increase
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._baseline_latency: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> float:
+        """Wait until another request is allowed to be sent.
+
+        :return: start time of the request, to be passed to :func:`release`
+        """
+        if self._in_flight >= self.limit or self._waiters:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # slot was handed over already, pass it on
+                    self._in_flight -= 1
+                    self._wake_up()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+        else:
+            self._in_flight += 1
+        return monotonic()
+
+    def release(self, started: float, *, overloaded: bool = False) -> None:
+        """Mark a request as finished and adjust the limit.
+
+        :param started: value returned by :func:`acquire`
+        :param overloaded: request was throttled or timed out
+        """
+        self._in_flight -= 1
+
+        latency = monotonic() - started
+        if not overloaded:
+            if self._baseline_latency is None or latency < self._baseline_latency:
+                self._baseline_latency = latency
+            else:
+                # let the baseline follow lasting changes of latency slowly
+                self._baseline_latency += (latency - self._baseline_latency) * 0.01
+            overloaded = latency > self._baseline_latency * self._latency_tolerance
+
+        if overloaded:
+            if started > self._last_decrease:
+                self._last_decrease = monotonic()
+                self._limit = max(self._min_limit, self._limit * self._decrease_factor)
+        else:
+            self._limit = min(
+                self._max_limit, self._limit + self._increase / self._limit
+            )
+
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
@@ -0,0 +1,150 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from time import monotonic
+from typing import Deque, Dict, List, Optional, Tuple
+
+from mercapi.util.jwt import DPoPSigner
+
+
+class DPoPProofPool:
+    """Keeps a small number of pre-signed DPoP proofs for selected requests,
+    so that sending them does not have to wait for signing.
+
+    Proofs are bound to the exact `(method, url)` pair of a request, including
+    the query string, in the same way as proofs generated on demand.
+    Each proof is handed out only once and proofs older than `max_age` seconds
+    are discarded.
+
+    The pool is refilled by :func:`run`, which is supposed to be run as a background task.
+    """
+
+    def __init__(
+        self,
+        signer: DPoPSigner,
+        *,
+        size: int = 2,
+        max_age: float = 30.0,
+    ):
+        """initialize
+
+        :param signer: signer used for generating proofs
+        :param size: number of proofs kept for every registered request
+        :param max_age: age in seconds after which a proof is no longer handed out
+        """
+        if size < 1:
+            raise ValueError("size must be a positive integer")
+
+        self._signer = signer
+        self._size = size
+        self._max_age = max_age
+        self._proofs: Dict[Tuple[str, str], Deque[Tuple[float, str]]] = {}
+        self._depleted: Optional[asyncio.Event] = None
+
+    def register(self, method: str, url: str) -> None:
+        """Start keeping proofs for a request.
+
+        :param method: HTTP method of the request
+        :param url: full URL of the request
+        """
+        self._proofs.setdefault((method, url), deque())
+        self._notify()
+
+    def unregister(self, method: str, url: str) -> None:
+        """Stop keeping proofs for a request and discard the ones already generated."""
+        self._proofs.pop((method, url), None)
+
+    def get(self, method: str, url: str) -> Optional[str]:
+        """Take a fresh proof for a request, if there is one available.
+
+        :param method: HTTP method of the request
+        :param url: full URL of the request
+        :return: DPoP proof or `None` if the request is not registered or there is no proof left
+        """
+        proofs = self._proofs.get((method, url))
+        if proofs is None:
+            return None
+
+        self._notify()
+        now = monotonic()
+        while proofs:
+            created, proof = proofs.popleft()
+            if now - created < self._max_age:
+                return proof
+        return None
+
+    def fill(self) -> None:
+        """Discard stale proofs and generate new ones up to the pool size."""
+        self._store(self._generate(self._discard_stale()))
+
+    async def refill(
+        self, *, offload: bool = False, executor: Optional[Executor] = None
+    ) -> None:
+        """Asynchronous variant of :func:`fill`.
+
+        :param offload: generate proofs in an executor instead of the event loop
+        :param executor: executor used if `offload` is set, event loop's default executor is used if not provided
+        """
+        missing = self._discard_stale()
+        if offload:
+            generated = await asyncio.get_running_loop().run_in_executor(
+                executor, self._generate, missing
+            )
+        else:
+            generated = self._generate(missing)
+        self._store(generated)
+
+    async def run(
+        self, *, offload: bool = False, executor: Optional[Executor] = None
+    ) -> None:
+        """Keep the pool filled until cancelled.
+
+        Accepts the same parameters as :func:`refill`.
+        """
+        self._depleted = asyncio.Event()
+        while True:
+            self._depleted.clear()
+            await self.refill(offload=offload, executor=executor)
+
+            # asyncio.wait_for is not used here, as before Python 3.12 it may
+            # swallow the cancellation if the awaited event is already set
+            waiters = {
+                asyncio.ensure_future(self._depleted.wait()),
+                asyncio.ensure_future(asyncio.sleep(self._max_age / 2)),
+            }
+            try:
+                await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+    def _notify(self) -> None:
+        if self._depleted is not None:
+            self._depleted.set()
+
+    def _discard_stale(self) -> Dict[Tuple[str, str], int]:
+        # proofs are refreshed halfway through their lifetime, so that
+        # one taken right before the refresh is still reasonably fresh
+        stale_before = monotonic() - self._max_age / 2
+        missing = {}
+        for request, proofs in self._proofs.items():
+            while proofs and proofs[0][0] < stale_before:
+                proofs.popleft()
+            missing[request] = self._size - len(proofs)
+        return missing
+
+    def _generate(
+        self, missing: Dict[Tuple[str, str], int]
+    ) -> List[Tuple[Tuple[str, str], float, str]]:
+        return [
+            ((method, url), monotonic(), self._signer.sign(url, method))
+            for (method, url), count in missing.items()
+            for _ in range(count)
+        ]
+
+    def _store(self, generated: List[Tuple[Tuple[str, str], float, str]]) -> None:
+        for request, created, proof in generated:
+            proofs = self._proofs.get(request)
+            # request may have been unregistered while proofs were generated
+            if proofs is not None:
+                proofs.append((created, proof))
@@ -1,3 +1,8 @@
+from typing import Optional
+
+import httpx
+
+
 class MercapiError(Exception):
     pass
 
@@ -8,3 +13,11 @@ class ParseAPIResponseError(MercapiError):
 
 class IncorrectRequestError(MercapiError):
     pass
+
+
+class RetryError(MercapiError):
+    """Request has failed on every attempt allowed by the retry policy."""
+
+    def __init__(self, message: str, response: Optional[httpx.Response] = None):
+        super().__init__(message)
+        self.response = response
@@ -0,0 +1,49 @@
+import json
+from typing import Any, Callable, Dict, Tuple
+
+JSONDecoder = Callable[[bytes], Any]
+"""Function decoding a JSON document from UTF-8 encoded bytes"""
+JSONEncoder = Callable[[Any], bytes]
+"""Function encoding an object as a UTF-8 encoded JSON document"""
+
+
+def _json_loads(data: bytes) -> Any:
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+JSON_BACKENDS: Dict[str, Tuple[JSONDecoder, JSONEncoder]] = {}
+"""Decoder and encoder of every installed JSON library, fastest first"""
+
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+    JSON_BACKENDS["orjson"] = (orjson.loads, orjson.dumps)
+
+try:
+    import msgspec
+except ImportError:
+    pass
+else:
+    JSON_BACKENDS["msgspec"] = (msgspec.json.decode, msgspec.json.encode)
+
+JSON_BACKENDS["json"] = (_json_loads, _json_dumps)
+
+
+def get_json_backend(backend: str = "auto") -> Tuple[JSONDecoder, JSONEncoder]:
+    """Get decoder and encoder of one of `JSON_BACKENDS`.
+
+    :param backend: name of the library, the fastest one installed is used if "auto"
+    """
+    if backend == "auto":
+        return next(iter(JSON_BACKENDS.values()))
+    if backend not in JSON_BACKENDS:
+        raise ValueError(
+            f"JSON backend {backend} is not available, expected one of: {', '.join(JSON_BACKENDS)}"
+        )
+    return JSON_BACKENDS[backend]
@@ -1,12 +1,128 @@
+import hashlib
+from abc import ABC, abstractmethod
+import json
 import random
 from time import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Type
 from uuid import UUID
 
-from ecdsa import SigningKey
-from jose import jws
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+from ecdsa import SigningKey, NIST256p
+from ecdsa.util import sigencode_string
 from jose.backends.ecdsa_backend import ECDSAECKey
 from jose.constants import ALGORITHMS
+from jose.utils import base64url_encode
+
+
+class DPoPSigner(ABC):
+    """Generates DPoP proofs signed with a single, fixed ES256 key.
+
+    The JWK and the encoded protected header depend on the key only,
+    so they are computed once, during the instantiation.
+    Subclasses implement the actual signing using a specific crypto backend.
+    """
+
+    def __init__(self, extra_payload: Optional[Dict[str, str]] = None):
+        self._extra_payload = extra_payload or {}
+
+        headers = {
+            "typ": "dpop+jwt",
+            "alg": "ES256",
+            "jwk": self.public_jwk(),
+        }
+        self._encoded_headers = base64url_encode(_json_dumps(headers, sort_keys=True))
+
+    @abstractmethod
+    def public_jwk(self) -> Dict[str, str]:
+        """Public part of the signing key in JWK format (RFC 7517)."""
+
+    @abstractmethod
+    def _sign(self, data: bytes) -> bytes:
+        """Sign `data` with ES256 and return the signature as raw `r || s` bytes."""
+
+    def sign(self, url: str, method: str) -> str:
+        """Generate a DPoP proof for a single request.
+
+        :param url: URL of the request (`htu` claim)
+        :param method: HTTP method of the request (`htm` claim)
+        :return: signed proof in JWS compact serialization
+        """
+        payload = {
+            "iat": int(time()),
+            "jti": str(UUID(int=random.getrandbits(128))),
+            "htu": url,
+            "htm": method,
+            **self._extra_payload,
+        }
+
+        signing_input = b".".join(
+            [self._encoded_headers, base64url_encode(_json_dumps(payload))]
+        )
+        signature = self._sign(signing_input)
+        return b".".join([signing_input, base64url_encode(signature)]).decode()
+
+
+class EcdsaDPoPSigner(DPoPSigner):
+    """Signer backed by the pure-Python `ecdsa` package."""
+
+    def __init__(
+        self,
+        key: Optional[SigningKey] = None,
+        extra_payload: Optional[Dict[str, str]] = None,
+    ):
+        self._key = key or SigningKey.generate(NIST256p)
+        super().__init__(extra_payload)
+
+    def public_jwk(self) -> Dict[str, str]:
+        jwk = ECDSAECKey(self._key, ALGORITHMS.ES256).to_dict()
+        return {k: jwk[k] for k in ["crv", "kty", "x", "y"]}
+
+    def _sign(self, data: bytes) -> bytes:
+        return self._key.sign(data, hashfunc=hashlib.sha256, sigencode=sigencode_string)
+
+
+class CryptographyDPoPSigner(DPoPSigner):
+    """Signer backed by the OpenSSL bindings of the `cryptography` package."""
+
+    def __init__(
+        self,
+        key: Optional[ec.EllipticCurvePrivateKey] = None,
+        extra_payload: Optional[Dict[str, str]] = None,
+    ):
+        self._key = key or ec.generate_private_key(ec.SECP256R1())
+        super().__init__(extra_payload)
+
+    def public_jwk(self) -> Dict[str, str]:
+        numbers = self._key.public_key().public_numbers()
+        return {
+            "crv": "P-256",
+            "kty": "EC",
+            "x": base64url_encode(numbers.x.to_bytes(32, "big")).decode(),
+            "y": base64url_encode(numbers.y.to_bytes(32, "big")).decode(),
+        }
+
+    def _sign(self, data: bytes) -> bytes:
+        r, s = decode_dss_signature(self._key.sign(data, ec.ECDSA(hashes.SHA256())))
+        return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+
+SIGNING_BACKENDS: Dict[str, Type[DPoPSigner]] = {
+    "ecdsa": EcdsaDPoPSigner,
+    "cryptography": CryptographyDPoPSigner,
+}
+
+
+def create_signer(
+    backend: str, extra_payload: Optional[Dict[str, str]] = None
+) -> DPoPSigner:
+    """Create a signer with a freshly generated key using one of `SIGNING_BACKENDS`."""
+    if backend not in SIGNING_BACKENDS:
+        raise ValueError(
+            f"Unknown signing backend {backend}, expected one of: {', '.join(SIGNING_BACKENDS)}"
+        )
+    return SIGNING_BACKENDS[backend](extra_payload=extra_payload)
 
 
 def generate_dpop(
@@ -15,19 +131,8 @@ def generate_dpop(
     key: SigningKey,
     extra_payload: Optional[Dict[str, str]] = None,
 ) -> str:
-    payload = {
-        "iat": int(time()),
-        "jti": str(UUID(int=random.getrandbits(128))),
-        "htu": url,
-        "htm": method,
-        **extra_payload,
-    }
-
-    ec_key = ECDSAECKey(key, ALGORITHMS.ES256)
-    headers = {
-        "typ": "dpop+jwt",
-        "alg": "ES256",
-        "jwk": {k: ec_key.to_dict()[k] for k in ["crv", "kty", "x", "y"]},
-    }
-
-    return jws.sign(payload, key, headers, ALGORITHMS.ES256)
+    return EcdsaDPoPSigner(key, extra_payload).sign(url, method)
+
+
+def _json_dumps(obj: dict, sort_keys: bool = False) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys).encode("utf-8")
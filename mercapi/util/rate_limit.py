@@ -0,0 +1,62 @@
+import asyncio
+from time import monotonic
+from typing import Dict, Mapping
+
+
+class TokenBucket:
+    """Asynchronous token bucket allowing `rate` acquisitions per second
+    with bursts of up to `burst` acquisitions.
+
+    Implemented as a virtual scheduler (GCRA): every acquisition reserves
+    the earliest slot conforming to the limit and sleeps until it comes,
+    so concurrent waiters are released in order and evenly spaced.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """initialize
+
+        :param rate: number of acquisitions per second
+        :param burst: number of acquisitions allowed at once after a period of inactivity
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be a positive integer")
+
+        self._interval = 1 / rate
+        self._tolerance = (burst - 1) * self._interval
+        self._next_slot = 0.0
+
+    def reserve(self) -> float:
+        """Reserve a slot without waiting for it.
+
+        :return: number of seconds until the reserved slot
+        """
+        now = monotonic()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self._interval
+        return max(0.0, slot - self._tolerance - now)
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Set of token buckets shared by all requests to a given endpoint."""
+
+    def __init__(self, limits: Mapping[str, float], burst: int = 1):
+        """initialize
+
+        :param limits: maximum number of requests per second for endpoints (see `mercapi.requests.Endpoint`), endpoints not listed are not limited
+        :param burst: number of requests to a single endpoint allowed at once after a period of inactivity
+        """
+        self._buckets: Dict[str, TokenBucket] = {
+            endpoint: TokenBucket(rate, burst) for endpoint, rate in limits.items()
+        }
+
+    async def acquire(self, endpoint: str) -> None:
+        bucket = self._buckets.get(endpoint)
+        if bucket is not None:
+            await bucket.acquire()
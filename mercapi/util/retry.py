@@ -0,0 +1,79 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import httpx
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Describes when and how failed requests are retried.
+
+    Delays grow exponentially with every attempt (`backoff_base * 2 ** (attempt - 1)`,
+    capped at `backoff_max`). With `jitter` enabled the actual delay is drawn uniformly
+    from `[0, delay]`, so that concurrent clients do not retry in lockstep.
+    `Retry-After` header of the response takes precedence over the computed delay.
+    """
+
+    max_attempts: int = 5
+    """Total number of attempts, including the first one"""
+
+    backoff_base: float = 0.5
+    """Delay before the first retry in seconds"""
+
+    backoff_max: float = 30.0
+    """Maximum delay between attempts in seconds"""
+
+    jitter: bool = True
+    """Randomize delays between attempts"""
+
+    retry_after_max: float = 120.0
+    """Maximum delay requested with `Retry-After` header that is honored, longer delays are shortened to it"""
+
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    """Response statuses the request is retried on"""
+
+    retry_transport_errors: bool = True
+    """Retry on connection errors and timeouts"""
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be a positive integer")
+
+    def should_retry(self, response: httpx.Response) -> bool:
+        return response.status_code in self.retry_statuses
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Delay before the next attempt.
+
+        :param attempt: number of the attempt that has just failed, starting from 1
+        :param response: response of the failed attempt, if any
+        :return: delay in seconds
+        """
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.retry_after_max)
+
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,40 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls with the same key.
+
+    While a call for a given key is in progress, subsequent calls
+    for that key wait for its result instead of starting their own.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Call `fn` unless a call with the same key is already in progress.
+
+        :param key: identifier of the call
+        :param fn: function starting the call
+        :return: result of the call, shared by all callers
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda f: self._finish(key, f))
+        # a cancelled caller must not cancel the call awaited by others
+        return await asyncio.shield(call)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def _finish(self, key: Hashable, call: asyncio.Future) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            # mark the exception as retrieved, in case all callers were cancelled
+            call.exception()
@@ -0,0 +1,106 @@
+import sqlite3
+import threading
+import zlib
+from time import time
+from typing import Dict, Mapping, Optional, Union
+
+from mercapi.requests import Endpoint
+from mercapi.util.cache import ResponseCache
+
+
+class SQLiteResponseStore:
+    """Persistent cache of raw API responses kept in a SQLite database.
+
+    Bodies are stored compressed, together with their expiry time, under the full
+    request URL. The database works in WAL mode, so it can be shared by many
+    processes reading and writing concurrently, and survives restarts.
+
+    Only successful responses to GET requests are stored.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[Mapping[Union[Endpoint, str], float]] = None,
+        *,
+        compression_level: int = 6,
+        timeout: float = 5.0,
+    ):
+        """initialize
+
+        :param path: path to the database file, created if it does not exist
+        :param ttl: time to live of stored responses in seconds for endpoints (see `mercapi.requests.Endpoint`), endpoints not listed are not stored; `ResponseCache.DEFAULT_TTL` is used if not provided
+        :param compression_level: zlib compression level of stored bodies
+        :param timeout: seconds to wait for a lock held by another process
+        """
+        if ttl is None:
+            ttl = ResponseCache.DEFAULT_TTL
+        self._ttl: Dict[str, float] = {Endpoint(k).value: v for k, v in ttl.items()}
+        self._compression_level = compression_level
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, endpoint TEXT NOT NULL, "
+            "body BLOB NOT NULL, expires REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)"
+        )
+
+    def stores(self, endpoint: Union[Endpoint, str]) -> bool:
+        return Endpoint(endpoint).value in self._ttl
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Get a stored response body.
+
+        :param url: full URL of the request
+        :return: response body or `None` if it is not stored or expired
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body FROM responses WHERE url = ? AND expires > ?",
+                (url, time()),
+            ).fetchone()
+        return zlib.decompress(row[0]) if row is not None else None
+
+    def set(self, endpoint: Union[Endpoint, str], url: str, body: bytes) -> None:
+        """Store a response body, if responses of the endpoint are stored.
+
+        :param endpoint: endpoint the response comes from
+        :param url: full URL of the request
+        :param body: response body
+        """
+        endpoint = Endpoint(endpoint).value
+        ttl = self._ttl.get(endpoint)
+        if ttl is None:
+            return
+        compressed = zlib.compress(body, self._compression_level)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (url, endpoint, body, expires) "
+                "VALUES (?, ?, ?, ?)",
+                (url, endpoint, compressed, time() + ttl),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired responses from the database.
+
+        :return: number of deleted responses
+        """
+        with self._lock:
+            return self._db.execute(
+                "DELETE FROM responses WHERE expires <= ?", (time(),)
+            ).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -11,7 +11,7 @@ async def main():
 
     # Make raw request
     req = api._item('m67451288459')
-    res = await api._client.send(req)
+    res = await api._send(req)
     response = res.json()
 
     # Check if auction_info exists in response
@@ -1,4 +1,6 @@
+import httpx
 import pytest
+import pytest_asyncio
 from vcr import VCR
 
 from mercapi import mercapi
@@ -15,3 +17,25 @@ def vcr_config():
 @pytest.fixture(scope="function")
 def m():
     return mercapi.Mercapi()
+
+
+@pytest_asyncio.fixture
+async def mock_api():
+    """Create `Mercapi` instances sending requests to a handler instead of the API.
+
+    Call it with a function handling `httpx.Request` (sync or async) and
+    `Mercapi` options; instances are closed after the test.
+    """
+    instances = []
+
+    async def create(handler, **options) -> mercapi.Mercapi:
+        api = mercapi.Mercapi(**options)
+        await api._client.aclose()
+        api._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        instances.append(api)
+        return api
+
+    yield create
+
+    for api in instances:
+        await api.aclose()
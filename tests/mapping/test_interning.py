@@ -0,0 +1,149 @@
+import gc
+import weakref
+from dataclasses import dataclass
+from typing import Optional, List
+
+import pytest
+
+import mercapi.mapping.definitions
+from mercapi.mapping.definitions import (
+    ResponseMappingDefinition,
+    ResponseProperty,
+    map_to_class,
+    Extractors,
+)
+from mercapi.mapping.interning import Interner
+from mercapi.models.base import ResponseModel
+
+
+@dataclass
+class ModelTestLookup(ResponseModel):
+    id_: int
+    name: Optional[str]
+
+
+@dataclass
+class ModelTestOwner(ResponseModel):
+    lookup: Optional[ModelTestLookup]
+    lookups: Optional[List[ModelTestLookup]]
+
+
+@pytest.fixture(autouse=True)
+def definitions(monkeypatch):
+    monkeypatch.setitem(
+        mercapi.mapping.definitions.mapping_definitions,
+        ModelTestLookup,
+        ResponseMappingDefinition(
+            [ResponseProperty("id", "id_", Extractors.get("id"))],
+            [ResponseProperty("name", "name", Extractors.get("name"))],
+        ),
+    )
+    monkeypatch.setitem(
+        mercapi.mapping.definitions.mapping_definitions,
+        ModelTestOwner,
+        ResponseMappingDefinition(
+            [],
+            [
+                ResponseProperty(
+                    "lookup",
+                    "lookup",
+                    Extractors.get_as_model("lookup", ModelTestLookup),
+                ),
+                ResponseProperty(
+                    "lookups",
+                    "lookups",
+                    Extractors.get_list_of_model("lookups", ModelTestLookup),
+                ),
+            ],
+        ),
+    )
+
+
+def test_interning_shares_instances():
+    interner = Interner([ModelTestLookup])
+    r = {"lookup": {"id": 1, "name": "foo"}, "lookups": [{"name": "foo", "id": 1}]}
+
+    first = map_to_class(r, ModelTestOwner, interner=interner)
+    second = map_to_class(r, ModelTestOwner, interner=interner)
+
+    assert first.lookup == ModelTestLookup(id_=1, name="foo")
+    assert first.lookup is second.lookup is first.lookups[0]
+    assert interner.stats.hits == 3 and interner.stats.misses == 1
+
+
+def test_interning_distinguishes_content_and_options():
+    interner = Interner([ModelTestLookup])
+
+    one = map_to_class({"lookup": {"id": 1}}, ModelTestOwner, interner=interner)
+    two = map_to_class({"lookup": {"id": 2}}, ModelTestOwner, interner=interner)
+    compact = map_to_class(
+        {"lookup": {"id": 1}}, ModelTestOwner, compact=True, interner=interner
+    )
+
+    assert one.lookup.id_ == 1 and two.lookup.id_ == 2
+    assert type(compact.lookup) is not ModelTestLookup
+    assert len(interner) == 3
+
+
+def test_interning_skips_nested_objects_and_other_models():
+    interner = Interner([ModelTestLookup])
+    r = {"lookup": {"id": 1, "name": ["foo"]}}
+
+    first = map_to_class(r, ModelTestOwner, interner=interner)
+    second = map_to_class(r, ModelTestOwner, interner=interner)
+
+    assert first.lookup == second.lookup and first.lookup is not second.lookup
+    assert not Interner().interns(ModelTestLookup)
+
+
+def test_interning_maxsize():
+    interner = Interner([ModelTestLookup], maxsize=2)
+
+    for i in range(3):
+        map_to_class({"lookup": {"id": i}}, ModelTestOwner, interner=interner)
+
+    assert len(interner) == 2
+    assert interner.stats.evictions == 1
+
+
+def test_interning_strings():
+    interner = Interner([], strings={ModelTestLookup: ["name"]})
+    names = [bytes(b"foo").decode() for _ in range(2)]
+    assert names[0] is not names[1]
+
+    first = map_to_class(
+        {"lookup": {"id": 1, "name": names[0]}}, ModelTestOwner, interner=interner
+    )
+    second = map_to_class(
+        {"lookups": [{"id": 2, "name": names[1]}]}, ModelTestOwner, interner=interner
+    )
+
+    assert first.lookup.name == "foo"
+    assert first.lookup.name is second.lookups[0].name
+    assert len(interner) == 0
+
+
+def test_interning_strings_keeps_other_values():
+    interner = Interner([], strings={ModelTestLookup: ["name"]}, max_strings=1)
+
+    assert interner.intern_string(None) is None
+    assert interner.intern_string(1) == 1
+    assert interner.intern_string(["a", "b"]) == ["a", "b"]
+    assert interner.string_properties(ModelTestOwner) == frozenset()
+    with pytest.raises(ValueError):
+        Interner(max_strings=0)
+
+
+def test_interner_mappers_freed_with_interner():
+    compiled = len(mercapi.mapping.definitions._compiled_mappers)
+    interners = []
+
+    for _ in range(10):
+        interner = Interner([ModelTestLookup])
+        map_to_class({"lookup": {"id": 1}}, ModelTestOwner, interner=interner)
+        interners.append(weakref.ref(interner))
+    del interner
+    gc.collect()
+
+    assert len(mercapi.mapping.definitions._compiled_mappers) == compiled
+    assert all(ref() is None for ref in interners)
@@ -1,4 +1,9 @@
+import copy
+import dataclasses
+import pickle
+from collections import OrderedDict
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional, Dict, Type, List, Any
 
 import pytest
@@ -10,7 +15,7 @@ from mercapi.mapping.definitions import (
     map_to_class,
     Extractors,
 )
-from mercapi.models.base import ResponseModel
+from mercapi.models.base import ResponseModel, compact_model
 from mercapi.util.errors import ParseAPIResponseError
 
 
@@ -161,3 +166,203 @@ def test_mapping_list_of_nested_objects(monkeypatch):
     model = map_to_class(r, ModelTestD)
     assert len(model.list_nested) == 1
     assert model.list_nested[0] == ModelTest(field_1="foo", field_2="bar")
+
+
+@dataclass
+class ModelTestE(ResponseModel):
+    count: int
+    created: datetime
+    upper: Optional[str]
+    price: Optional[int]
+
+
+mapping_definition_e = ResponseMappingDefinition(
+    [
+        ResponseProperty("count", "count", Extractors.get_as("count", int)),
+        ResponseProperty("created", "created", Extractors.get_datetime("created")),
+    ],
+    [
+        ResponseProperty(
+            "upper", "upper", Extractors.get_with("name", lambda x: x.upper())
+        ),
+        ResponseProperty("price", "price", Extractors.get_as("price", int)),
+    ],
+)
+
+
+def test_compiled_mapping_matches_extractors():
+    r = {"count": "3", "created": "1650000000", "name": "foo", "price": "120"}
+    model = map_to_class(r, ModelTestE, mapping_definition_e)
+
+    assert model == ModelTestE(
+        count=Extractors.get_as("count", int)(r),
+        created=Extractors.get_datetime("created")(r),
+        upper="FOO",
+        price=120,
+    )
+
+
+def test_compiled_mapping_reports_incorrect_optional(caplog):
+    r = {"count": 3, "created": 1650000000, "name": 1, "price": "not a number"}
+    model = map_to_class(r, ModelTestE, mapping_definition_e)
+
+    assert model.upper is None
+    assert model.price is None
+    assert "property upper" in caplog.text
+    assert "property price" in caplog.text
+
+
+def test_compiled_mapping_keeps_required_error_message():
+    r = {"created": 1650000000}
+    with pytest.raises(ParseAPIResponseError) as exc_info:
+        map_to_class(r, ModelTestE, mapping_definition_e)
+
+    assert str(exc_info.value) == (
+        "Failed to retrieve required ModelTestE property count from the response"
+    )
+    assert isinstance(exc_info.value.__cause__, ValueError)
+
+
+def test_compiled_mapping_is_cached_per_definition(monkeypatch):
+    r = {"field1": "foo", "field2": "bar"}
+    compiled = []
+    compile_mapping = mercapi.mapping.definitions.compile_mapping
+
+    def counting_compile_mapping(clazz, mapping_definition, *args):
+        compiled.append(clazz)
+        return compile_mapping(clazz, mapping_definition, *args)
+
+    monkeypatch.setattr(
+        mercapi.mapping.definitions, "compile_mapping", counting_compile_mapping
+    )
+    monkeypatch.setattr(mercapi.mapping.definitions, "_compiled_mappers", OrderedDict())
+    other_definition = ResponseMappingDefinition(
+        [ResponseProperty("field2", "field_1", Extractors.get("field2"))],
+        [ResponseProperty("field1", "field_2", Extractors.get("field3"))],
+    )
+    map_to_class(r, ModelTest, mapping_definitions[ModelTest])
+    map_to_class(r, ModelTest, mapping_definitions[ModelTest])
+    model = map_to_class(r, ModelTest, other_definition)
+
+    assert compiled == [ModelTest, ModelTest]
+    assert model == ModelTest(field_1="bar", field_2=None)
+
+
+def test_compiled_mappers_are_bounded(monkeypatch):
+    monkeypatch.setattr(mercapi.mapping.definitions, "_compiled_mappers", OrderedDict())
+    monkeypatch.setattr(mercapi.mapping.definitions, "COMPILED_MAPPERS_MAXSIZE", 2)
+    r = {"count": "3", "created": 1650000000, "price": "120"}
+
+    for fields in (["count"], ["count", "price"], ["count"], ["count", "created"]):
+        map_to_class(r, ModelTestE, mapping_definition_e, fields=fields)
+
+    assert [key[2] for key in mercapi.mapping.definitions._compiled_mappers] == [
+        frozenset(["count"]),
+        frozenset(["count", "created"]),
+    ]
+
+
+def test_mapping_selected_fields():
+    r = {"count": "3", "name": "foo", "price": "120"}
+    model = map_to_class(r, ModelTestE, mapping_definition_e, fields=["count", "price"])
+
+    assert model == ModelTestE(count=3, created=None, upper=None, price=120)
+
+
+def test_mapping_selected_fields_still_required():
+    r = {"created": 1650000000}
+    with pytest.raises(ParseAPIResponseError):
+        map_to_class(r, ModelTestE, mapping_definition_e, fields=["count"])
+
+
+def test_mapping_unknown_fields():
+    with pytest.raises(ValueError):
+        map_to_class({}, ModelTestE, mapping_definition_e, fields=["count", "foo"])
+
+
+@pytest.fixture
+def nested_definitions(monkeypatch):
+    for clazz in (ModelTest, ModelTestB, ModelTestBNested, ModelTestD):
+        monkeypatch.setitem(
+            mercapi.mapping.definitions.mapping_definitions,
+            clazz,
+            mapping_definitions[clazz],
+        )
+
+
+def test_lazy_mapping_of_nested_object(nested_definitions):
+    r = {"field1": "foo", "fieldNested": {"fieldA": "bar", "fieldB": "baz"}}
+    model = map_to_class(r, ModelTestB, lazy=True)
+
+    assert isinstance(model, ModelTestB)
+    assert model.field_1 == "foo"
+    assert "field_nested" not in model.__dict__
+    assert model.field_nested.field_a == "bar"
+    assert model.field_nested is model.field_nested
+    assert model == map_to_class(r, ModelTestB, lazy=True)
+
+
+def test_lazy_mapping_of_list_of_nested_objects(nested_definitions):
+    r = {"listNested": [{"field1": "foo", "field2": "bar"}]}
+    model = map_to_class(r, ModelTestD, lazy=True)
+
+    assert "list_nested" not in model.__dict__
+    assert model.list_nested[0].field_1 == "foo"
+
+
+def test_lazy_mapping_of_missing_required_nested_object(nested_definitions):
+    model = map_to_class({"field1": "foo"}, ModelTestB, lazy=True)
+
+    with pytest.raises(ParseAPIResponseError):
+        model.field_nested
+
+
+def test_lazy_mapping_assignment(nested_definitions):
+    r = {"field1": "foo", "fieldNested": {"fieldA": "bar"}}
+    model = map_to_class(r, ModelTestB, lazy=True)
+    model.field_nested = None
+
+    assert model.field_nested is None
+
+
+def test_lazy_model_pickling(nested_definitions):
+    r = {"field1": "foo", "fieldNested": {"fieldA": "bar"}}
+    model = map_to_class(r, ModelTestB, lazy=True)
+
+    restored = pickle.loads(pickle.dumps(model))
+
+    assert type(restored) is ModelTestB
+    assert restored == map_to_class(r, ModelTestB)
+
+
+def test_lazy_compact_mapping(nested_definitions):
+    r = {"field1": "foo", "fieldNested": {"fieldA": "bar"}}
+    model = map_to_class(r, ModelTestB, lazy=True, compact=True)
+
+    assert not hasattr(model, "__dict__")
+    assert model.field_nested.field_a == "bar"
+    assert model.field_nested is model.field_nested
+    restored = pickle.loads(pickle.dumps(model))
+    assert type(restored) is compact_model(ModelTestB)
+    assert restored == map_to_class(r, ModelTestB, compact=True)
+
+
+def test_compact_mapping(nested_definitions):
+    r = {"field1": "foo", "fieldNested": {"fieldA": "bar", "fieldB": "baz"}}
+    regular = map_to_class(r, ModelTestB)
+    model = map_to_class(r, ModelTestB, compact=True)
+
+    assert type(model) is compact_model(ModelTestB)
+    assert type(model.field_nested) is compact_model(ModelTestBNested)
+    assert not hasattr(model, "__dict__")
+    assert dataclasses.astuple(model) == dataclasses.astuple(regular)
+    with pytest.raises(AttributeError):
+        model.foo = "bar"
+
+
+def test_compact_model_pickling(nested_definitions):
+    r = {"field1": "foo", "fieldNested": {"fieldA": "bar"}}
+    model = map_to_class(r, ModelTestB, compact=True)
+
+    assert pickle.loads(pickle.dumps(model)) == model
+    assert copy.copy(model) == model
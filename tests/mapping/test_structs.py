@@ -0,0 +1,127 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, List
+
+import httpx
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+import mercapi.mapping.definitions
+from mercapi.mapping.definitions import (
+    ResponseMappingDefinition,
+    ResponseProperty,
+    map_to_class,
+    Extractors,
+)
+from mercapi.mapping.structs import struct_type, struct_decoder
+from mercapi.models import Item
+from mercapi.models.base import ResponseModel
+from mercapi.util.errors import ParseAPIResponseError
+
+
+@dataclass
+class ModelTestNode(ResponseModel):
+    id_: int
+    created: datetime
+    name: Optional[str]
+    color: Optional[int]
+    children: Optional[List["ModelTestNode"]]
+
+
+node_definition = ResponseMappingDefinition(
+    [
+        ResponseProperty("id", "id_", Extractors.get_as("id", int)),
+        ResponseProperty("created", "created", Extractors.get_datetime("created")),
+    ],
+    [
+        ResponseProperty(
+            "name|displayName", "name", Extractors.get_either("name", "displayName")
+        ),
+        ResponseProperty(
+            "rgb", "color", Extractors.get_with("rgb", lambda x: int(x[1:], 16))
+        ),
+        ResponseProperty(
+            "children",
+            "children",
+            Extractors.get_list_of_model("children", ModelTestNode),
+        ),
+    ],
+)
+
+
+@pytest.fixture
+def node_definitions(monkeypatch):
+    monkeypatch.setitem(
+        mercapi.mapping.definitions.mapping_definitions, ModelTestNode, node_definition
+    )
+
+
+def test_struct_matches_model(node_definitions):
+    r = {
+        "id": "1",
+        "created": "1650000000",
+        "displayName": "foo",
+        "children": [{"id": 2, "created": 1650000001, "name": "bar", "rgb": "#ff"}],
+    }
+
+    struct = struct_decoder(ModelTestNode)(json.dumps(r).encode())
+    model = map_to_class(r, ModelTestNode)
+
+    assert type(struct).__name__ == "ModelTestNodeStruct"
+    assert msgspec.structs.asdict(struct)["id_"] == model.id_ == 1
+    assert struct.created == model.created
+    assert struct.name == model.name == "foo"
+    assert struct.color is None
+    assert struct.children[0].name == "bar"
+    assert struct.children[0].color == model.children[0].color == 255
+
+
+def test_struct_missing_required_property(node_definitions):
+    with pytest.raises(ParseAPIResponseError):
+        struct_decoder(ModelTestNode)(b'{"created": 1650000000}')
+
+
+def test_struct_envelope(node_definitions):
+    struct = struct_decoder(ModelTestNode, "data")(
+        b'{"data": {"id": 1, "created": 1650000000}}'
+    )
+
+    assert struct.id_ == 1
+
+
+def test_struct_types_of_all_models():
+    for clazz in mercapi.mapping.definitions.mapping_definitions:
+        assert issubclass(struct_type(clazz), msgspec.Struct)
+
+
+@pytest.mark.asyncio
+async def test_mercapi_item_struct(mock_api):
+    body = {
+        "data": {
+            "id": "m1",
+            "status": "on_sale",
+            "name": "foo",
+            "price": 1,
+            "updated": 1650000000,
+        }
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["id"] == "m0":
+            return httpx.Response(404)
+        return httpx.Response(200, json=body)
+
+    m = await mock_api(handler)
+
+    struct = await m.item("m1", struct=True)
+    model = await m.item("m1")
+
+    assert isinstance(struct, struct_type(Item))
+    assert (struct.id_, struct.price, struct.updated) == (
+        model.id_,
+        model.price,
+        model.updated,
+    )
+    assert await m.item("m0", struct=True) is None
@@ -0,0 +1,162 @@
+from datetime import datetime
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from mercapi.models.search import SearchResultColumns
+from mercapi.models.search.columns import NULL
+from mercapi.util.errors import ParseAPIResponseError
+
+ITEMS = [
+    {
+        "id": "m1",
+        "sellerId": "10",
+        "status": "ITEM_STATUS_ON_SALE",
+        "name": "foo",
+        "price": "1000",
+        "created": "1702784710",
+        "updated": "1702888925",
+        "itemConditionId": "5",
+        "shippingPayerId": "2",
+        "shippingMethodId": "14",
+        "categoryId": "694",
+        "itemBrand": {"id": "123", "name": "brand", "subName": "BRAND"},
+        "isNoPrice": False,
+    },
+    {
+        "id": "m2",
+        "status": "ITEM_STATUS_SOLD_OUT",
+        "name": "bar",
+        "price": "9999999",
+        "itemBrand": None,
+        "isNoPrice": True,
+    },
+]
+
+
+@pytest_asyncio.fixture
+async def mocked(mock_api):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = {
+            "meta": {"nextPageToken": "", "previousPageToken": "", "numFound": "2"},
+            "items": ITEMS,
+        }
+        return httpx.Response(200, json=body)
+
+    return await mock_api(handler)
+
+
+def test_columns_from_response():
+    columns = SearchResultColumns.from_response(ITEMS)
+
+    assert len(columns) == 2
+    assert columns.id_ == ["m1", "m2"]
+    assert columns.seller_id == ["10", None]
+    assert list(columns.price) == [1000, 9999999]
+    assert list(columns.created) == [1702784710, NULL]
+    assert list(columns.category_id) == [694, NULL]
+    assert list(columns.brand_id) == [123, NULL]
+    assert list(columns.is_no_price) == [0, 1]
+    assert [columns.statuses[c] for c in columns.status] == [
+        "ITEM_STATUS_ON_SALE",
+        "ITEM_STATUS_SOLD_OUT",
+    ]
+
+
+def test_columns_from_response_incorrect():
+    with pytest.raises(ParseAPIResponseError):
+        SearchResultColumns.from_response([{"id": "m1", "price": "free"}])
+
+
+@pytest.mark.asyncio
+async def test_search_results_to_columns(mocked):
+    results = await mocked.search("foo")
+    raw = await mocked.search("foo", raw=True)
+
+    assert results.to_columns() == SearchResultColumns.from_response(raw["items"])
+
+
+def test_columns_extend_remaps_statuses():
+    columns = SearchResultColumns.from_response(ITEMS[1:])
+    columns.extend(SearchResultColumns.from_response(ITEMS))
+    columns.extend(SearchResultColumns.from_response([{"id": "m3", "price": "1"}]))
+
+    assert columns.id_ == ["m2", "m1", "m2", "m3"]
+    assert columns.statuses == ["ITEM_STATUS_SOLD_OUT", "ITEM_STATUS_ON_SALE"]
+    assert list(columns.status) == [0, 1, 0, NULL]
+    assert list(columns.price) == [9999999, 1000, 9999999, 1]
+
+
+def test_columns_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    columns = SearchResultColumns.from_response(ITEMS)
+
+    arrays = columns.to_numpy()
+
+    assert arrays["price"].dtype == numpy.int64
+    assert arrays["price"].tolist() == [1000, 9999999]
+    assert arrays["status"].tolist() == list(columns.status)
+    assert arrays["id_"].tolist() == ["m1", "m2"]
+    assert SearchResultColumns().to_numpy()["created"].shape == (0,)
+
+
+@pytest.fixture
+def columns():
+    pytest.importorskip("numpy")
+    return SearchResultColumns.from_response(
+        [
+            {
+                "id": "a",
+                "price": "300",
+                "created": "30",
+                "status": "S1",
+                "categoryId": "1",
+            },
+            {
+                "id": "b",
+                "price": "100",
+                "created": "10",
+                "status": "S2",
+                "categoryId": "2",
+            },
+            {
+                "id": "c",
+                "price": "200",
+                "created": "30",
+                "status": "S1",
+                "isNoPrice": True,
+            },
+            {"id": "d", "price": "100", "status": "S2", "itemBrand": {"id": "7"}},
+        ]
+    )
+
+
+def test_columns_filter(columns):
+    assert columns.filter(price_min=150).id_ == ["a", "c"]
+    assert columns.filter(price_max=150).id_ == ["b", "d"]
+    assert columns.filter(created_after=20).id_ == ["a", "c"]
+    assert columns.filter(created_before=datetime.fromtimestamp(20)).id_ == ["b"]
+    assert columns.filter(statuses=["S2", "S3"]).id_ == ["b", "d"]
+    assert columns.filter(categories=[1, 2], price_min=200).id_ == ["a"]
+    assert columns.filter(brands={7}).id_ == ["d"]
+    assert columns.filter(is_no_price=True).id_ == ["c"]
+    assert len(columns.filter(statuses=["S3"])) == 0
+
+
+def test_columns_take(columns):
+    taken = columns.take([3, 0])
+
+    assert taken.id_ == ["d", "a"]
+    assert list(taken.price) == [100, 300]
+    assert [taken.statuses[c] for c in taken.status] == ["S2", "S1"]
+    assert taken.to_numpy()["brand_id"].tolist() == [7, NULL]
+
+
+def test_columns_sort_is_stable(columns):
+    assert columns.sort("created").id_ == ["d", "b", "a", "c"]
+    assert columns.sort("created", descending=True).id_ == ["a", "c", "b", "d"]
+    assert columns.sort("price").id_ == ["b", "d", "c", "a"]
+    with pytest.raises(ValueError):
+        columns.sort("name")
+    assert len(columns.take([])) == 0
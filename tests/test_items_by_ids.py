@@ -0,0 +1,83 @@
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from mercapi.util.errors import ParseAPIResponseError
+
+
+def _item_body(id_):
+    return {
+        "result": "OK",
+        "data": {"id": id_, "status": "on_sale", "name": f"item {id_}", "price": 100},
+    }
+
+
+@pytest_asyncio.fixture
+async def mocked(mock_api):
+    state = {"in_flight": 0, "max_in_flight": 0, "requested": []}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        id_ = request.url.params["id"]
+        state["requested"].append(id_)
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        if id_.startswith("missing"):
+            return httpx.Response(404, json={"result": "error"})
+        return httpx.Response(200, json=_item_body(id_))
+
+    return await mock_api(handler), state
+
+
+@pytest.mark.asyncio
+async def test_items_by_ids_preserves_order(mocked):
+    m, state = mocked
+    ids = [f"m{i}" for i in range(10)] + ["missing1"]
+
+    res = await m.items_by_ids(ids, concurrency=3)
+
+    assert [i.id_ for i in res[:-1]] == ids[:-1]
+    assert res[-1] is None
+    assert state["max_in_flight"] <= 3
+
+
+@pytest.mark.asyncio
+async def test_items_by_ids_fetches_duplicates_once(mocked):
+    m, state = mocked
+
+    res = await m.items_by_ids(["m1", "m2", "m1"])
+
+    assert [i.id_ for i in res] == ["m1", "m2", "m1"]
+    assert sorted(state["requested"]) == ["m1", "m2"]
+
+
+@pytest.mark.asyncio
+async def test_iter_items_by_ids(mocked):
+    m, state = mocked
+    ids = [f"m{i}" for i in range(5)] + ["missing1"]
+
+    res = {id_: item async for id_, item in m.iter_items_by_ids(ids, concurrency=2)}
+
+    assert set(res.keys()) == set(ids)
+    assert res["missing1"] is None
+    assert res["m3"].id_ == "m3"
+    assert state["max_in_flight"] <= 2
+
+
+@pytest.mark.asyncio
+async def test_iter_items_by_ids_propagates_errors(mock_api):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        id_ = request.url.params["id"]
+        if id_ == "broken":
+            return httpx.Response(200, json={"result": "OK", "data": {}})
+        await asyncio.sleep(1)
+        return httpx.Response(200, json=_item_body(id_))
+
+    m = await mock_api(handler)
+
+    with pytest.raises(ParseAPIResponseError):
+        async for _ in m.iter_items_by_ids(["broken", "m1", "m2"], concurrency=3):
+            pass
@@ -0,0 +1,79 @@
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from mercapi.util.cache import ResponseCache
+
+
+@pytest_asyncio.fixture
+async def mocked(mock_api):
+    pages = {"": "v1:1", "v1:1": ""}
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("items/get"):
+            requested.append(request.url.params["id"])
+            body = {
+                "data": {
+                    "id": request.url.params["id"],
+                    "status": "on_sale",
+                    "name": "foo",
+                    "price": 1,
+                    "checksum": "a",
+                }
+            }
+            return httpx.Response(200, json=body)
+
+        token = json.loads(request.content)["pageToken"] or ""
+        requested.append(token)
+        body = {
+            "meta": {
+                "nextPageToken": pages[token],
+                "previousPageToken": "",
+                "numFound": "2",
+            },
+            "items": [{"id": f"m{token}", "name": "item", "price": "100"}],
+        }
+        return httpx.Response(200, json=body)
+
+    return await mock_api(handler, cache=ResponseCache()), requested
+
+
+@pytest.mark.asyncio
+async def test_search_fields(mocked):
+    m, _ = mocked
+
+    page = await m.search("sharpnel", fields=["id_", "price"])
+    next_page = await page.next_page()
+
+    for res in (page, next_page):
+        assert res.meta.num_found == 2
+        assert res.items[0].price == 100
+        assert res.items[0].name is None
+    assert next_page.items[0].id_ == "mv1:1"
+
+
+@pytest.mark.asyncio
+async def test_search_iter_fields(mocked):
+    m, _ = mocked
+
+    items = [item async for item in m.search_iter("sharpnel", fields=["id_"])]
+
+    assert [item.id_ for item in items] == ["m", "mv1:1"]
+    assert all(item.price is None for item in items)
+
+
+@pytest.mark.asyncio
+async def test_item_fields_cached_apart(mocked):
+    m, requested = mocked
+
+    projected = await m.item("m1", fields=["id_", "price"])
+    full = await m.item("m1")
+    projected_again = await m.item("m1", fields=("price", "id_"))
+
+    assert projected.name is None and projected.price == 1
+    assert full.name == "foo"
+    assert projected_again is projected
+    assert requested == ["m1", "m1"]
@@ -0,0 +1,66 @@
+import httpx
+import pytest
+import pytest_asyncio
+
+from mercapi.util.cache import ResponseCache
+
+
+@pytest_asyncio.fixture
+async def mocked(mock_api):
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path.endswith("items/get"):
+            if request.url.params["id"] == "m0":
+                return httpx.Response(404)
+            return httpx.Response(
+                200, json={"data": {"id": request.url.params["id"], "price": 1}}
+            )
+        if request.url.path.endswith("entities:search"):
+            return httpx.Response(200, json={"meta": {}, "items": [{"id": "m1"}]})
+        return httpx.Response(200, json={"data": {"id": "foo"}})
+
+    return await mock_api(handler, cache=ResponseCache()), requested
+
+
+@pytest.mark.asyncio
+async def test_item_raw(mocked):
+    m, requested = mocked
+
+    first = await m.item("m1", raw=True)
+    second = await m.item("m1", raw=True)
+
+    assert first == {"data": {"id": "m1", "price": 1}}
+    assert second == first and second is not first
+    assert len(requested) == 2
+
+
+@pytest.mark.asyncio
+async def test_item_raw_not_found(mocked):
+    m, _ = mocked
+
+    assert await m.item("m0", raw=True) is None
+
+
+@pytest.mark.asyncio
+async def test_search_raw(mocked):
+    m, _ = mocked
+
+    res = await m.search("sharpnel", raw=True)
+
+    assert res == {"meta": {}, "items": [{"id": "m1"}]}
+
+
+@pytest.mark.asyncio
+async def test_profile_items_shop_product_raw(mocked):
+    m, requested = mocked
+
+    assert await m.profile("1", raw=True) == {"data": {"id": "foo"}}
+    assert await m.items("1", raw=True) == {"data": {"id": "foo"}}
+    assert await m.shop_product("p1", raw=True) == {"data": {"id": "foo"}}
+    assert requested == [
+        "/users/get_profile",
+        "/items/get_items",
+        "/v1/marketplaces/shops/products/p1",
+    ]
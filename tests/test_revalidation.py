@@ -0,0 +1,63 @@
+import httpx
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture
+async def mocked(mock_api):
+    state = {"checksums": {"m1": "a", "m2": "b"}, "requested": []}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        id_ = request.url.params["id"]
+        state["requested"].append(id_)
+        if id_ not in state["checksums"]:
+            return httpx.Response(404)
+        body = {
+            "data": {
+                "id": id_,
+                "status": "on_sale",
+                "name": "foo",
+                "price": 1,
+                "checksum": state["checksums"][id_],
+            }
+        }
+        return httpx.Response(200, json=body)
+
+    return await mock_api(handler), state
+
+
+@pytest.mark.asyncio
+async def test_revalidate_item(mocked):
+    m, state = mocked
+
+    first = await m.revalidate_item("m1")
+    second = await m.revalidate_item("m1")
+    state["checksums"]["m1"] = "c"
+    third = await m.revalidate_item("m1")
+
+    assert not first.unchanged
+    assert second.unchanged and second.item is first.item
+    assert not third.unchanged and third.item is not first.item
+    assert third.item.checksum == "c"
+    assert state["requested"] == ["m1", "m1", "m1"]
+
+
+@pytest.mark.asyncio
+async def test_revalidate_missing_item(mocked):
+    m, state = mocked
+
+    res = await m.revalidate_item("m0")
+
+    assert res.item is None
+    assert not res.unchanged
+
+
+@pytest.mark.asyncio
+async def test_revalidate_items(mocked):
+    m, state = mocked
+    await m.revalidate_item("m1")
+
+    res = await m.revalidate_items(["m1", "m2", "m0"])
+
+    assert [r.unchanged for r in res] == [True, False, False]
+    assert [r.item.id_ if r.item else None for r in res] == ["m1", "m2", None]
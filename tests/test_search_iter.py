@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+
+
+def _page(token, next_token, count=2):
+    return {
+        "meta": {
+            "nextPageToken": next_token,
+            "previousPageToken": "",
+            "numFound": "6",
+        },
+        "items": [
+            {"id": f"m{token or 'first'}{i}", "name": "item", "price": "100"}
+            for i in range(count)
+        ],
+    }
+
+
+@pytest_asyncio.fixture
+async def mocked(mock_api):
+    pages = {"": "v1:1", "v1:1": "v1:2", "v1:2": ""}
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        token = json.loads(request.content)["pageToken"] or ""
+        requested.append(token)
+        return httpx.Response(200, json=_page(token, pages[token]))
+
+    return await mock_api(handler), requested
+
+
+@pytest.mark.asyncio
+async def test_search_iter_all_pages(mocked):
+    m, requested = mocked
+
+    ids = [item.id_ async for item in m.search_iter("sharpnel")]
+
+    assert len(ids) == 6
+    assert requested == ["", "v1:1", "v1:2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_search_iter_max_pages(mocked, prefetch):
+    m, requested = mocked
+
+    ids = [
+        item.id_
+        async for item in m.search_iter("sharpnel", max_pages=2, prefetch=prefetch)
+    ]
+
+    assert len(ids) == 4
+    assert requested == ["", "v1:1"]
+
+
+@pytest.mark.asyncio
+async def test_search_iter_prefetches_next_page(mocked):
+    m, requested = mocked
+
+    it = m.search_iter("sharpnel")
+    await it.__anext__()
+    await asyncio.sleep(0.01)
+
+    assert requested == ["", "v1:1"]
+    await it.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("option", ["raw", "struct"])
+async def test_search_iter_rejects_unsupported_options(mocked, option):
+    m, requested = mocked
+
+    with pytest.raises(TypeError):
+        async for _ in m.search_iter("sharpnel", **{option: True}):
+            pass
+    assert requested == []
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from jose import jws
+
+
+
+def _handler(seen):
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("DPoP"))
+        return httpx.Response(404)
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_inline_signing(mock_api):
+    seen = []
+    m = await mock_api(_handler(seen))
+
+    await m.item("m1")
+
+    assert len(seen) == 1 and seen[0] is not None
+
+
+@pytest.mark.asyncio
+async def test_offloaded_signing_default_executor(mock_api):
+    threads = []
+    seen = []
+    m = await mock_api(_handler(seen), offload_signing=True)
+    sign = m._signer.sign
+
+    def recording_sign(url, method):
+        threads.append(threading.current_thread())
+        return sign(url, method)
+
+    m._signer.sign = recording_sign
+
+    await m.item("m1")
+
+    assert len(seen) == 1 and seen[0] is not None
+    assert threads and threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_offloaded_signing(mock_api):
+    threads = []
+    seen = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        m = await mock_api(_handler(seen), signing_executor=executor)
+        sign = m._signer.sign
+
+        def recording_sign(url, method):
+            threads.append(threading.current_thread())
+            return sign(url, method)
+
+        m._signer.sign = recording_sign
+
+        await m.item("m1")
+
+    assert len(seen) == 1 and seen[0] is not None
+    assert threads and threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_pooled_signing(mock_api):
+    url = "https://api.mercari.jp/items/get?id=m1&include_auction=true"
+    seen = []
+    m = await mock_api(_handler(seen), dpop_pool_size=1)
+    m.watch(item_ids=["m1"])
+
+    async with m:
+        pooled = m._dpop_pool._proofs[("GET", url)][0][1]
+        await m.item("m1")
+        await m.item("m2")
+
+    assert seen[0] == pooled
+    claims = json.loads(jws.get_unverified_claims(seen[1]))
+    assert (
+        claims["htu"] == "https://api.mercari.jp/items/get?id=m2&include_auction=true"
+    )
+    assert m._dpop_pool_task is None
+
+
+@pytest.mark.asyncio
+async def test_pool_started_once_by_concurrent_requests(mock_api):
+    m = await mock_api(_handler([]), dpop_pool_size=2, offload_signing=True)
+    m.watch(item_ids=["m1"])
+    runs = []
+    run = m._dpop_pool.run
+
+    def recording_run(**kwargs):
+        runs.append(kwargs)
+        return run(**kwargs)
+
+    m._dpop_pool.run = recording_run
+
+    await asyncio.gather(*[m.item(f"m{i}") for i in range(5)])
+    task = m._dpop_pool_task
+    await m.aclose()
+
+    assert len(runs) == 1
+    assert task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_pool_task_failure_is_raised(mock_api):
+    m = await mock_api(_handler([]), dpop_pool_size=1)
+    m.watch(item_ids=["m1"])
+    await m.start()
+
+    def failing_sign(url, method):
+        raise RuntimeError("signing failed")
+
+    m._signer.sign = failing_sign
+    m._dpop_pool.get(
+        "GET", "https://api.mercari.jp/items/get?id=m1&include_auction=true"
+    )
+    await asyncio.gather(m._dpop_pool_task, return_exceptions=True)
+
+    with pytest.raises(RuntimeError):
+        await m.item("m1")
+
+
+def test_watch_without_pool(m):
+    with pytest.raises(ValueError):
+        m.watch(item_ids=["m1"])
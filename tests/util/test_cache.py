@@ -0,0 +1,124 @@
+import time
+
+import httpx
+import pytest
+
+from mercapi.requests import Endpoint
+from mercapi.util.cache import MISSING, ResponseCache, TTLCache
+
+
+def test_ttl_cache_hit_and_miss():
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    assert cache.get("a") is MISSING
+    cache.set("a", None)
+
+    assert cache.get("a") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_ttl_cache_expiry():
+    cache = TTLCache(maxsize=2, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+
+    assert cache.get("a") is MISSING
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_response_cache_per_endpoint_ttl():
+    cache = ResponseCache(ttl={Endpoint.ITEM: 60, "users/get_profile": 0})
+    cache.set(Endpoint.ITEM, ("m1",), "item")
+    cache.set(Endpoint.PROFILE, ("1",), "profile")
+    cache.set(Endpoint.ITEMS, ("1",), "items")
+
+    assert cache.get("items/get", ("m1",)) == "item"
+    assert cache.get(Endpoint.PROFILE, ("1",)) is MISSING
+    assert cache.get(Endpoint.ITEMS, ("1",)) is MISSING
+    assert not cache.caches(Endpoint.ITEMS)
+    assert cache.endpoint_stats(Endpoint.ITEM) == (1, 0)
+    assert cache.endpoint_stats(Endpoint.PROFILE) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_mercapi_caches_items(mock_api):
+    cache = ResponseCache()
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params["id"])
+        if request.url.params["id"] == "m0":
+            return httpx.Response(404)
+        body = {"data": {"id": "m1", "status": "on_sale", "name": "foo", "price": 1}}
+        return httpx.Response(200, json=body)
+
+    m = await mock_api(handler, cache=cache)
+
+    a = await m.item("m1")
+    b = await m.item("m1")
+    await m.item("m0")
+    await m.item("m0")
+
+    assert a is b
+    assert requested == ["m1", "m0", "m0"]
+    assert cache.endpoint_stats(Endpoint.ITEM) == (1, 3)
+
+
+def test_response_cache_negative_results():
+    cache = ResponseCache(negative_ttl=60)
+    cache.set(Endpoint.ITEM, ("m0",), None)
+
+    assert cache.get(Endpoint.ITEM, ("m0",)) is None
+    assert cache.negative_stats.hits == 1
+    assert cache.stats.size == 0
+
+    cache.set(Endpoint.ITEM, ("m0",), "item")
+    assert cache.get(Endpoint.ITEM, ("m0",)) == "item"
+    assert cache.negative_stats.size == 0
+
+
+def test_response_cache_negative_results_disabled():
+    cache = ResponseCache()
+    cache.set(Endpoint.ITEM, ("m0",), None)
+
+    assert cache.get(Endpoint.ITEM, ("m0",)) is MISSING
+    assert cache.negative_stats is None
+
+
+def test_response_cache_negative_results_expiry():
+    cache = ResponseCache(negative_ttl=0.01)
+    cache.set(Endpoint.PROFILE, ("1",), None)
+    time.sleep(0.02)
+
+    assert cache.get(Endpoint.PROFILE, ("1",)) is MISSING
+
+
+@pytest.mark.asyncio
+async def test_mercapi_caches_not_found_items(mock_api):
+    cache = ResponseCache(negative_ttl=60)
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params["id"])
+        return httpx.Response(404)
+
+    m = await mock_api(handler, cache=cache)
+
+    assert await m.item("m0") is None
+    assert await m.item("m0") is None
+    assert requested == ["m0"]
+    assert cache.negative_stats.hits == 1
@@ -0,0 +1,103 @@
+import asyncio
+
+import httpx
+import pytest
+
+from mercapi.util.concurrency import AdaptiveConcurrencyLimiter
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_additively():
+    limiter = AdaptiveConcurrencyLimiter(4, latency_tolerance=float("inf"))
+
+    for _ in range(4):
+        limiter.release(await limiter.acquire())
+
+    assert limiter.limit == 4
+    assert 4.9 < limiter._limit < 5
+    limiter.release(await limiter.acquire())
+    assert limiter.limit == 5
+
+
+@pytest.mark.asyncio
+async def test_limit_shrinks_once_per_burst_of_overloads():
+    limiter = AdaptiveConcurrencyLimiter(8)
+
+    started = [await limiter.acquire() for _ in range(4)]
+    for s in started:
+        limiter.release(s, overloaded=True)
+
+    assert limiter.limit == 4
+    limiter.release(await limiter.acquire(), overloaded=True)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limit_stays_within_bounds():
+    limiter = AdaptiveConcurrencyLimiter(
+        2, min_limit=2, max_limit=3, latency_tolerance=float("inf")
+    )
+
+    limiter.release(await limiter.acquire(), overloaded=True)
+    assert limiter.limit == 2
+    for _ in range(20):
+        limiter.release(await limiter.acquire())
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_latency_spike_is_overload():
+    limiter = AdaptiveConcurrencyLimiter(8, latency_tolerance=2)
+    limiter.release(await limiter.acquire())
+    limiter._baseline_latency = 0.001
+
+    started = await limiter.acquire()
+    await asyncio.sleep(0.02)
+    limiter.release(started)
+
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_admitted_up_to_limit():
+    limiter = AdaptiveConcurrencyLimiter(2, latency_tolerance=float("inf"))
+    first, second = await limiter.acquire(), await limiter.acquire()
+
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release(first)
+    await asyncio.sleep(0)
+    assert waiter.done()
+    assert limiter.in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    limiter = AdaptiveConcurrencyLimiter(1)
+    started = await limiter.acquire()
+
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    limiter.release(started)
+
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_mercapi_backs_off_on_throttling(mock_api):
+    limiter = AdaptiveConcurrencyLimiter(8)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(429, json={})
+
+    m = await mock_api(handler, concurrency_limiter=limiter)
+
+    await asyncio.gather(*[m._send(m._item(f"m{i}")) for i in range(4)])
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import time
+
+import pytest
+from jose import jws
+
+from mercapi.util.dpop_pool import DPoPProofPool
+from mercapi.util.jwt import create_signer
+
+ITEM_URL = "https://api.mercari.jp/items/get?id=m1&include_auction=true"
+
+
+@pytest.fixture
+def pool():
+    pool = DPoPProofPool(create_signer("cryptography"), size=2)
+    pool.register("GET", ITEM_URL)
+    return pool
+
+
+async def _wait_for_proof(pool, method, url, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        proof = pool.get(method, url)
+        if proof is not None:
+            return proof
+        await asyncio.sleep(0.01)
+    return None
+
+
+def test_get_from_empty_pool(pool):
+    assert pool.get("GET", ITEM_URL) is None
+
+
+def test_get_unregistered_request(pool):
+    pool.fill()
+    assert pool.get("POST", ITEM_URL) is None
+    assert pool.get("GET", "https://api.mercari.jp/items/get?id=m2") is None
+
+
+def test_proofs_are_handed_out_once(pool):
+    pool.fill()
+
+    a = pool.get("GET", ITEM_URL)
+    b = pool.get("GET", ITEM_URL)
+
+    assert a is not None and b is not None and a != b
+    assert pool.get("GET", ITEM_URL) is None
+    claims = json.loads(jws.get_unverified_claims(a))
+    assert claims["htu"] == ITEM_URL
+    assert claims["htm"] == "GET"
+
+
+def test_unregister(pool):
+    pool.fill()
+    pool.unregister("GET", ITEM_URL)
+
+    assert pool.get("GET", ITEM_URL) is None
+
+
+def test_stale_proofs_are_not_handed_out():
+    pool = DPoPProofPool(create_signer("cryptography"), size=1, max_age=0.01)
+    pool.register("GET", ITEM_URL)
+    pool.fill()
+    time.sleep(0.02)
+
+    assert pool.get("GET", ITEM_URL) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("offload", [False, True])
+async def test_run_refills_pool(pool, offload):
+    task = asyncio.ensure_future(pool.run(offload=offload))
+    try:
+        assert await _wait_for_proof(pool, "GET", ITEM_URL) is not None
+        assert await _wait_for_proof(pool, "GET", ITEM_URL) is not None
+        # pool is depleted now, run() has to be woken up to refill it
+        assert await _wait_for_proof(pool, "GET", ITEM_URL) is not None
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_run_can_be_cancelled_while_notified(pool):
+    task = asyncio.ensure_future(pool.run())
+    await _wait_for_proof(pool, "GET", ITEM_URL)
+
+    pool.get("GET", ITEM_URL)
+    task.cancel()
+    await asyncio.wait_for(asyncio.gather(task, return_exceptions=True), 1)
+
+    assert task.cancelled()
@@ -0,0 +1,53 @@
+import httpx
+import pytest
+
+from mercapi.util.json_codec import JSON_BACKENDS, get_json_backend
+
+
+@pytest.mark.parametrize("backend", list(JSON_BACKENDS))
+def test_round_trip(backend):
+    loads, dumps = get_json_backend(backend)
+    obj = {"keyword": "シャープネル", "pageToken": None, "priceMin": 0, "ids": [1, 2]}
+
+    encoded = dumps(obj)
+
+    assert isinstance(encoded, bytes)
+    assert loads(encoded) == obj
+    assert loads('{"name": "\\u30b7"}'.encode()) == {"name": "シ"}
+
+
+def test_auto_backend():
+    assert get_json_backend() == next(iter(JSON_BACKENDS.values()))
+    assert "json" in JSON_BACKENDS
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_json_backend("simplejson")
+
+
+@pytest.mark.asyncio
+async def test_mercapi_json_hooks(mock_api):
+    decoded = []
+    encoded = []
+    loads, dumps = get_json_backend("json")
+
+    def decoder(data):
+        decoded.append(data)
+        return loads(data)
+
+    def encoder(obj):
+        encoded.append(obj)
+        return dumps(obj)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Content-Type"] == "application/json"
+        assert loads(request.content)["searchCondition"]["keyword"] == "sharpnel"
+        return httpx.Response(200, json={"meta": {}, "items": []})
+
+    m = await mock_api(handler, json_decoder=decoder, json_encoder=encoder)
+
+    res = await m.search("sharpnel", raw=True)
+
+    assert res == {"meta": {}, "items": []}
+    assert len(decoded) == 1 and len(encoded) == 1
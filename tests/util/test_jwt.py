@@ -0,0 +1,61 @@
+import json
+
+import pytest
+from ecdsa import SigningKey, NIST256p
+from jose import jws, jwk
+from jose.constants import ALGORITHMS
+
+from mercapi.util.jwt import (
+    DPoPSigner,
+    EcdsaDPoPSigner,
+    SIGNING_BACKENDS,
+    create_signer,
+    generate_dpop,
+)
+
+
+@pytest.mark.parametrize("backend", SIGNING_BACKENDS.keys())
+def test_dpop_signer_produces_valid_proof(backend):
+    signer = create_signer(backend, {"uuid": "foo"})
+
+    token = signer.sign("https://api.mercari.jp/items/get?id=m1", "GET")
+
+    headers = jws.get_unverified_headers(token)
+    assert headers["typ"] == "dpop+jwt"
+    assert headers["alg"] == "ES256"
+    assert headers["jwk"] == signer.public_jwk()
+
+    public_key = jwk.construct(headers["jwk"], ALGORITHMS.ES256)
+    payload = json.loads(jws.verify(token, public_key, ALGORITHMS.ES256))
+    assert payload["htu"] == "https://api.mercari.jp/items/get?id=m1"
+    assert payload["htm"] == "GET"
+    assert payload["uuid"] == "foo"
+
+
+@pytest.mark.parametrize("backend", SIGNING_BACKENDS.keys())
+def test_dpop_signer_generates_unique_proofs(backend):
+    signer = create_signer(backend)
+
+    a = jws.get_unverified_claims(signer.sign("https://example.com", "GET"))
+    b = jws.get_unverified_claims(signer.sign("https://example.com", "GET"))
+
+    assert json.loads(a)["jti"] != json.loads(b)["jti"]
+
+
+def test_create_signer_unknown_backend():
+    with pytest.raises(ValueError):
+        create_signer("foo")
+
+
+def test_generate_dpop_matches_signer_headers():
+    key = SigningKey.generate(NIST256p)
+
+    token = generate_dpop("https://example.com", "POST", key, {"uuid": "foo"})
+    signer_token = EcdsaDPoPSigner(key).sign("https://example.com", "POST")
+
+    assert token.split(".")[0] == signer_token.split(".")[0]
+
+
+def test_dpop_signer_is_abstract():
+    with pytest.raises(TypeError):
+        DPoPSigner()
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from mercapi import Mercapi
+from mercapi.requests import Endpoint
+from mercapi.util.rate_limit import RateLimiter, TokenBucket
+
+
+def test_token_bucket_spaces_reservations():
+    bucket = TokenBucket(rate=10)
+
+    delays = [bucket.reserve() for _ in range(3)]
+
+    assert delays[0] == 0
+    assert delays[1] == pytest.approx(0.1, abs=0.01)
+    assert delays[2] == pytest.approx(0.2, abs=0.01)
+
+
+def test_token_bucket_allows_bursts():
+    bucket = TokenBucket(rate=10, burst=3)
+
+    delays = [bucket.reserve() for _ in range(4)]
+
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_limits_listed_endpoints_only():
+    limiter = RateLimiter({"items/get": 20})
+
+    start = time.monotonic()
+    await asyncio.gather(*[limiter.acquire("items/get") for _ in range(5)])
+    limited = time.monotonic() - start
+
+    start = time.monotonic()
+    await asyncio.gather(*[limiter.acquire("entities:search") for _ in range(5)])
+    unlimited = time.monotonic() - start
+
+    assert limited >= 0.19
+    assert unlimited < 0.05
+
+
+def test_endpoint_of_request():
+    m = Mercapi()
+
+    assert Endpoint.of(m._item("m1")) == Endpoint.ITEM
+    assert Endpoint.of(m._profile("1")) == Endpoint.PROFILE
+    assert Endpoint.of(m._items("1")) == Endpoint.ITEMS
+    assert Endpoint.of(m._shop_product("abc")) == Endpoint.SHOP_PRODUCT
+    assert Endpoint.of(httpx.Request("GET", "https://example.com")) is None
+
+
+def test_unknown_rate_limited_endpoint():
+    with pytest.raises(ValueError):
+        Mercapi(rate_limits={"items/foo": 1})
+
+
+@pytest.mark.asyncio
+async def test_mercapi_rate_limits_requests(mock_api):
+    m = await mock_api(lambda r: httpx.Response(404), rate_limits={Endpoint.ITEM: 20})
+
+    start = time.monotonic()
+    await asyncio.gather(*[m.item(f"m{i}") for i in range(5)])
+
+    assert time.monotonic() - start >= 0.19
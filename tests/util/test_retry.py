@@ -0,0 +1,96 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from mercapi.util.errors import RetryError
+from mercapi.util.retry import RetryPolicy
+
+NO_DELAY = RetryPolicy(max_attempts=3, backoff_base=0, jitter=False)
+
+
+def test_exponential_backoff():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+
+    assert [policy.delay(i) for i in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_jitter_stays_within_backoff():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+
+    assert all(0 <= policy.delay(3) <= 4 for _ in range(100))
+
+
+def test_retry_after_seconds():
+    policy = RetryPolicy(retry_after_max=10)
+
+    assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "3"})) == 3
+    assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "60"})) == 10
+
+
+def test_retry_after_date():
+    policy = RetryPolicy()
+    date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), True)
+
+    delay = policy.delay(1, httpx.Response(503, headers={"Retry-After": date}))
+
+    assert 28 <= delay <= 30
+
+
+def _handler(statuses, seen):
+    statuses = iter(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["DPoP"])
+        status = next(statuses)
+        if isinstance(status, Exception):
+            raise status
+        body = {"data": {"id": "m1", "status": "on_sale", "name": "foo", "price": 1}}
+        return httpx.Response(status, json=body)
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_request_is_retried_with_fresh_proof(mock_api):
+    seen = []
+    m = await mock_api(_handler([503, 429, 200], seen), retry=NO_DELAY)
+
+    res = await m.item("m1")
+
+    assert res.id_ == "m1"
+    assert len(seen) == 3 and len(set(seen)) == 3
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_are_retried(mock_api):
+    seen = []
+    m = await mock_api(
+        _handler([httpx.ConnectError("failed"), 200], seen), retry=NO_DELAY
+    )
+
+    res = await m.item("m1")
+
+    assert res.id_ == "m1"
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_not_retried(mock_api):
+    seen = []
+    m = await mock_api(_handler([404], seen), retry=NO_DELAY)
+
+    assert await m.item("m1") is None
+    assert len(seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_are_exhausted(mock_api):
+    seen = []
+    m = await mock_api(_handler([503, 503, 503, 200], seen), retry=NO_DELAY)
+
+    with pytest.raises(RetryError) as exc_info:
+        await m.item("m1")
+
+    assert exc_info.value.response.status_code == 503
+    assert len(seen) == 3
@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+import pytest
+
+from mercapi.util.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_shared():
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    sf = SingleFlight()
+    a, b = await asyncio.gather(sf.do("k", fn), sf.do("k", fn))
+    c = await sf.do("k", fn)
+
+    assert a is b
+    assert c is not a
+    assert len(calls) == 2
+    assert sf.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared():
+    async def fn():
+        await asyncio.sleep(0.01)
+        raise RuntimeError()
+
+    sf = SingleFlight()
+    res = await asyncio.gather(sf.do("k", fn), sf.do("k", fn), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in res)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    async def fn():
+        await asyncio.sleep(0.01)
+        return 1
+
+    sf = SingleFlight()
+    first = asyncio.ensure_future(sf.do("k", fn))
+    second = asyncio.ensure_future(sf.do("k", fn))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == 1
+
+
+def _handler(requested):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        await asyncio.sleep(0.01)
+        body = {"data": {"id": "m1", "status": "on_sale", "name": "foo", "price": 1}}
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_mercapi_coalesces_item_requests(mock_api):
+    requested = []
+    m = await mock_api(_handler(requested))
+
+    a, b = await asyncio.gather(m.item("m1"), m.item("m1"))
+
+    assert a is b
+    assert len(requested) == 1
+
+
+@pytest.mark.asyncio
+async def test_mercapi_coalescing_disabled(mock_api):
+    requested = []
+    m = await mock_api(_handler(requested), coalesce_requests=False)
+
+    a, b = await asyncio.gather(m.item("m1"), m.item("m1"))
+
+    assert a is not b
+    assert len(requested) == 2
@@ -0,0 +1,62 @@
+import time
+
+import httpx
+import pytest
+
+from mercapi.requests import Endpoint
+from mercapi.util.sqlite_cache import SQLiteResponseStore
+
+URL = "https://api.mercari.jp/items/get?id=m1&include_auction=true"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteResponseStore(str(tmp_path / "cache.db"))
+    yield store
+    store.close()
+
+
+def test_store_round_trip(store):
+    store.set(Endpoint.ITEM, URL, b'{"data": {}}')
+
+    assert store.get(URL) == b'{"data": {}}'
+    assert store.get(URL.replace("m1", "m2")) is None
+
+
+def test_store_is_shared_between_connections(store, tmp_path):
+    store.set(Endpoint.ITEM, URL, b"{}")
+
+    other = SQLiteResponseStore(str(tmp_path / "cache.db"))
+    assert other.get(URL) == b"{}"
+    other.close()
+
+
+def test_store_expiry(tmp_path):
+    store = SQLiteResponseStore(str(tmp_path / "cache.db"), {Endpoint.ITEM: 0.01})
+    store.set(Endpoint.ITEM, URL, b"{}")
+    store.set(Endpoint.PROFILE, "https://api.mercari.jp/users/get_profile", b"{}")
+    time.sleep(0.02)
+
+    assert store.get(URL) is None
+    assert store.purge_expired() == 1
+    assert not store.stores(Endpoint.PROFILE)
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_mercapi_uses_stored_responses(store, mock_api):
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params["id"])
+        if request.url.params["id"] == "m0":
+            return httpx.Response(404)
+        body = {"data": {"id": "m1", "status": "on_sale", "name": "foo", "price": 1}}
+        return httpx.Response(200, json=body)
+
+    for _ in range(2):
+        m = await mock_api(handler, response_store=store)
+        assert (await m.item("m1")).id_ == "m1"
+        assert await m.item("m0") is None
+
+    assert requested == ["m1", "m0", "m0"]
@@ -0,0 +1,57 @@
+"""Compare memory used by regular, compact and interned models of search results from test cassettes.
+
+Every copy of the results is decoded from the response bodies again, as if it came from another request.
+
+Usage: python utils/benchmark_models.py [copies]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+import yaml
+
+from mercapi.mapping import map_to_class
+from mercapi.mapping.interning import Interner
+from mercapi.models import SearchResultItem
+
+CASSETTES = Path(__file__).parent.parent / 'tests' / 'cassettes'
+
+
+def search_result_bodies():
+    for path in sorted(CASSETTES.glob('test_search*.yml')):
+        for interaction in yaml.safe_load(path.read_text())['interactions']:
+            content = interaction['response'].get('content')
+            try:
+                if 'items' in json.loads(content):
+                    yield content
+            except (TypeError, ValueError):
+                continue
+
+
+def measure(bodies, copies, **options):
+    gc.collect()
+    tracemalloc.start()
+    models = [
+        map_to_class(i, SearchResultItem, **options)
+        for _ in range(copies)
+        for body in bodies
+        for i in json.loads(body)['items'] or []
+    ]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(models)
+
+
+if __name__ == '__main__':
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    bodies = list(search_result_bodies())
+    print(f'{sum(len(json.loads(b)["items"] or []) for b in bodies) * copies} search result items')
+
+    for name, options in [
+        ('regular', {}),
+        ('compact', {'compact': True}),
+        ('interned', {'interner': Interner()}),
+    ]:
+        print(f'{name:>8}: {measure(bodies, copies, **options):8.0f} B/item')
@@ -0,0 +1,17 @@
+"""Compare the throughput of DPoP signing backends.
+
+Usage: python utils/benchmark_signing.py [iterations]
+"""
+import sys
+import timeit
+
+from mercapi.util import jwt
+
+if __name__ == '__main__':
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    url = 'https://api.mercari.jp/items/get?id=m12871737078&include_auction=true'
+
+    for backend in jwt.SIGNING_BACKENDS:
+        signer = jwt.create_signer(backend, {'uuid': 'b020c828-d0e7-5ad6-69ef-dbb73bc28f36'})
+        elapsed = timeit.timeit(lambda: signer.sign(url, 'GET'), number=iterations)
+        print(f'{backend:>14}: {iterations / elapsed:10.0f} proofs/s ({elapsed / iterations * 1e6:8.1f} us/proof)')